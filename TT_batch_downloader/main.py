@@ -9,17 +9,23 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import logging
-import re
-import zipfile
+import math
+import sqlite3
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator, Literal
 
-import pandas as pd
-
-from TT_batch_downloader.tiktok_data_collector import TikTokVideoCollector, TikTokDownloadError
-from TT_batch_downloader.models import Video, Metadata
+from TT_batch_downloader.tiktok_data_collector import (
+    TikTokDownloadError,
+    TikTokVideoCollector,
+    backoff_delay,
+)
+from TT_batch_downloader.url_extractor import URLExtractor
 
 # Configure logging
 logging.basicConfig(
@@ -33,262 +39,302 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class FileType:
-    """File type constants."""
-
-    ZIP = "zip"
-    TEXT = "text"
-    UNKNOWN = "unknown"
-
-
-class URLExtractor:
-    """Extract URLs from various file formats with encoding detection."""
+class _UrlBloomFilter:
+    """Fixed-size Bloom filter over URL strings.
 
-    ENCODINGS = ["utf-8", "iso-8859-1", "gbk", "gb2312", "latin1"]
-    SEPARATORS = [",", ";", "\t"]
+    Used by :class:`DownloadTracker` in place of a ``set`` once a tracking CSV
+    grows past ``DownloadTracker.BLOOM_THRESHOLD`` rows. Positives may be false
+    and must be confirmed against the CSV; negatives are exact.
+    """
 
-    def extract_from_file(self, file_path: str | Path) -> list[str]:
-        """Extract URLs from CSV, TXT, or ZIP files.
+    def __init__(self, capacity: int, error_rate: float = 1e-6) -> None:
+        """Size the bit array for the expected number of items.
 
         Args:
-            file_path: Path to the file to extract URLs from.
-
-        Returns:
-            List of valid URLs found in the file.
-
-        Raises:
-            ValueError: If no URLs can be extracted.
+            capacity: Expected number of distinct URLs.
+            error_rate: Target false-positive probability at capacity.
         """
-        file_path = Path(file_path)
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self._size = max(8, math.ceil(bits))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hash_count))
 
-        file_type = self._check_file_type(file_path)
-        logger.info(f"Detected file type: {file_type}")
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
 
-        if file_type == FileType.ZIP:
-            return self._extract_from_zip(file_path)
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
 
-        return self._extract_from_text_file(file_path)
 
-    def _check_file_type(self, file_path: Path) -> str:
-        """Detect file type by reading magic bytes.
+def _url_hash(url: str) -> int:
+    """Return a 32-bit hash of a URL for the tracker's row index."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
 
-        Args:
-            file_path: Path to the file.
 
-        Returns:
-            File type constant.
-        """
-        try:
-            with open(file_path, "rb") as f:
-                header = f.read(4)
+def _first_csv_field(line: bytes) -> str:
+    """Return the first field (the URL) of one raw tracking-CSV line."""
+    text = line.decode("utf-8")
+    if text.startswith('"'):
+        return next(csv.reader([text]))[0]
+    return text.split(",", 1)[0].rstrip("\r\n")
 
-            # Check for ZIP file magic number (PK)
-            if header[:2] == b"PK":
-                return FileType.ZIP
 
-            # Try to read as text to detect CSV/text
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    first_line = f.readline().strip()
-                    if any(sep in first_line for sep in [",", ";", "\t"]):
-                        return FileType.TEXT
-                    return FileType.TEXT
-            except UnicodeDecodeError:
-                pass
+class DownloadTracker:
+    """Track download progress and avoid duplicate downloads.
 
-        except Exception as e:
-            logger.error(f"Error checking file type: {e}")
+    Rows are appended through a single buffered file handle that stays open
+    until :meth:`close`, and is flushed every ``FLUSH_EVERY`` records.
+
+    Trackers with more than ``BLOOM_THRESHOLD`` rows keep a Bloom filter
+    instead of ``existing_urls``. Filter hits are confirmed through an index
+    of URL hash to row offset built while loading, so each check reads only
+    the candidate rows; URLs recorded since loading are kept in a set.
+    """
 
-        return FileType.UNKNOWN
+    CSV_FILENAME = "id2url.csv"
+    FLUSH_EVERY = 10
+    BLOOM_THRESHOLD = 100_000
+    # Average rows per row-index bucket; a confirmation scans one bucket
+    ROWS_PER_BUCKET = 64
 
-    def _extract_from_zip(self, zip_path: Path) -> list[str]:
-        """Extract URLs from a ZIP archive.
+    def __init__(self, csv_path: Path) -> None:
+        """Initialize tracker with CSV file path.
 
         Args:
-            zip_path: Path to the ZIP file.
-
-        Returns:
-            List of extracted URLs.
+            csv_path: Path to the tracking CSV file.
         """
-        extract_folder = zip_path.parent / f"{zip_path.stem}_extracted"
-        extract_folder.mkdir(exist_ok=True)
+        self.csv_path = csv_path
+        self.existing_urls: set[str] = set()
+        self.bloom: _UrlBloomFilter | None = None
+        # Row index (Bloom mode only): per-bucket URL hashes and row offsets
+        self._row_hashes: list[array] = []
+        self._row_offsets: list[array] = []
+        self._recorded_since_load: set[str] = set()
+        self._fh: IO[str] | None = None
+        self._writer: Any = None
+        self._unflushed = 0
+        self._load_existing_urls()
 
-        try:
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_folder)
+    def __enter__(self) -> DownloadTracker:
+        return self
 
-            # Look for CSV files first
-            for csv_file in extract_folder.rglob("*.csv"):
-                logger.info(f"Found CSV in ZIP: {csv_file}")
-                urls = self._extract_from_text_file(csv_file)
-                if urls:
-                    return urls
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-            # If no CSV found, look for TXT files
-            for txt_file in extract_folder.rglob("*.txt"):
-                logger.info(f"Found TXT in ZIP: {txt_file}")
-                urls = self._extract_from_text_file(txt_file)
-                if urls:
-                    return urls
+    @property
+    def urls_in_memory(self) -> bool:
+        """True when ``existing_urls`` holds every tracked URL."""
+        return self.bloom is None
 
-            raise ValueError("No CSV or TXT files found in ZIP archive")
+    def _load_existing_urls(self) -> None:
+        """Load existing URLs from CSV file."""
+        if self.csv_path.exists():
+            try:
+                with open(self.csv_path, "rb") as f:
+                    row_count = max(0, sum(1 for _ in f) - 1)
 
-        except Exception as e:
-            logger.error(f"Error extracting from ZIP: {e}")
-            raise
+                if row_count > self.BLOOM_THRESHOLD:
+                    self.bloom = _UrlBloomFilter(capacity=row_count * 2)
+                    self._index_rows(row_count)
+                else:
+                    with open(self.csv_path, "r", newline="", encoding="utf-8") as f:
+                        self.existing_urls = {
+                            row["url"] for row in csv.DictReader(f) if row.get("url")
+                        }
+                logger.info(f"Loaded {row_count} existing URLs")
+            except Exception as e:
+                logger.warning(f"Error loading existing URLs: {e}")
 
-    def _extract_from_text_file(self, file_path: Path) -> list[str]:
-        """Extract URLs from a CSV or text file.
+        self._ensure_csv_exists()
 
-        Args:
-            file_path: Path to the text/CSV file.
+    def _index_rows(self, row_count: int) -> None:
+        """Fill the Bloom filter and row index from the CSV in one pass.
 
-        Returns:
-            List of extracted URLs.
+        The tracker writes the URL as the first column and neither field
+        contains a newline, so each physical line is one row.
         """
-        # Try parsing as CSV with different encodings and separators
-        for encoding in self.ENCODINGS:
-            for separator in self.SEPARATORS:
-                try:
-                    urls = self._try_read_csv(file_path, encoding, separator)
-                    if urls:
-                        logger.info(
-                            f"Successfully read {len(urls)} URLs using "
-                            f"encoding={encoding}, separator='{separator}'"
-                        )
-                        return urls
-                except Exception:
-                    continue
-
-        # Fallback: extract URLs using regex
-        return self._extract_urls_regex(file_path)
-
-    def _try_read_csv(
-        self, file_path: Path, encoding: str, separator: str
-    ) -> list[str]:
-        """Try reading file as CSV with specific parameters.
+        assert self.bloom is not None
+        bucket_count = max(1, row_count // self.ROWS_PER_BUCKET)
+        self._row_hashes = [array("I") for _ in range(bucket_count)]
+        self._row_offsets = [array("Q") for _ in range(bucket_count)]
+
+        with open(self.csv_path, "rb") as f:
+            offset = len(f.readline())  # header
+            for line in f:
+                url = _first_csv_field(line)
+                if url:
+                    self.bloom.add(url)
+                    url_hash = _url_hash(url)
+                    bucket = url_hash % bucket_count
+                    self._row_hashes[bucket].append(url_hash)
+                    self._row_offsets[bucket].append(offset)
+                offset += len(line)
+
+    def _ensure_csv_exists(self) -> None:
+        """Create CSV file with headers if it doesn't exist."""
+        if not self.csv_path.exists():
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["url", "Video Path"])
+
+    def is_processed(self, url: str) -> bool:
+        """Check if URL has already been processed.
 
         Args:
-            file_path: Path to the CSV file.
-            encoding: Text encoding to use.
-            separator: Field separator.
+            url: URL to check.
 
         Returns:
-            List of URLs extracted from the CSV.
-
-        Raises:
-            Exception: If CSV parsing fails.
+            True if URL was already processed.
         """
-        df = pd.read_csv(file_path, encoding=encoding, sep=separator, on_bad_lines="skip")
-
-        # Find URL column
-        url_column = self._find_url_column(df)
-        if not url_column:
-            return []
-
-        # Extract and validate URLs
-        urls = df[url_column].dropna().tolist()
-        return [url for url in urls if isinstance(url, str) and url.startswith("http")]
+        if self.bloom is None:
+            return url in self.existing_urls
+        return url in self.bloom and self._confirm_in_csv(url)
 
-    def _find_url_column(self, df: pd.DataFrame) -> str | None:
-        """Find the column containing URLs.
+    def _confirm_in_csv(self, url: str) -> bool:
+        """Confirm a Bloom filter hit against the rows indexed at load time.
 
         Args:
-            df: DataFrame to search.
+            url: URL reported present by the Bloom filter.
 
         Returns:
-            Column name containing URLs or None.
+            True if the URL was recorded since loading or a CSV row holds it.
         """
-        # Check for 'url' column
-        if "url" in df.columns:
-            return "url"
+        if url in self._recorded_since_load:
+            return True
+
+        url_hash = _url_hash(url)
+        bucket = url_hash % len(self._row_hashes)
+        offsets = self._row_offsets[bucket]
+        candidates = [
+            offsets[i] for i, h in enumerate(self._row_hashes[bucket]) if h == url_hash
+        ]
+        if not candidates:
+            return False
+
+        with open(self.csv_path, "rb") as f:
+            for offset in candidates:
+                f.seek(offset)
+                if _first_csv_field(f.readline()) == url:
+                    return True
+        return False
 
-        # Search for columns with url/link in name
-        for col in df.columns:
-            if any(keyword in col.lower() for keyword in ["url", "link"]):
-                return col
-
-        # Check first column's values
-        if not df.empty:
-            first_col = df.columns[0]
-            sample_values = df[first_col].dropna().head(5).tolist()
-            if any(
-                isinstance(v, str) and v.startswith("http") for v in sample_values
-            ):
-                return first_col
-
-        return None
-
-    def _extract_urls_regex(self, file_path: Path) -> list[str]:
-        """Extract URLs from file using regex.
+    def record_download(self, url: str, video_path: str) -> None:
+        """Record a successful download to the CSV.
 
         Args:
-            file_path: Path to the file.
-
-        Returns:
-            List of URLs found.
+            url: The downloaded video URL.
+            video_path: Path where video was saved.
         """
-        for encoding in self.ENCODINGS:
-            try:
-                with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                    content = f.read()
+        try:
+            if self._fh is None:
+                # Kept open across records on purpose; close() (via the context
+                # manager or download_all's finally) releases it
+                self._fh = open(  # noqa: SIM115
+                    self.csv_path, "a", newline="", encoding="utf-8", buffering=8192
+                )
+                self._writer = csv.writer(self._fh)
 
-                # 协议白名单过滤：仅允许 http/https，防止 javascript: 等恶意协议
-                all_urls = re.findall(r"https?://[^\s,\"';]+", content)
-                urls = [u for u in all_urls if u.startswith(("http://", "https://"))]
+            self._writer.writerow([url, video_path])
+            if self.bloom is None:
+                self.existing_urls.add(url)
+            else:
+                self.bloom.add(url)
+                self._recorded_since_load.add(url)
+
+            self._unflushed += 1
+            if self._unflushed >= self.FLUSH_EVERY:
+                self.flush()
 
-                if urls:
-                    logger.info(f"Extracted {len(urls)} URLs using regex")
-                    return urls
+            logger.debug("Recorded download: %s", url)
+        except Exception as e:
+            logger.error("Error recording download: %s", e)
 
+    def flush(self) -> None:
+        """Flush buffered rows to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush and close the append handle; it is reopened on next record."""
+        if self._fh is not None:
+            try:
+                self._fh.close()
             except Exception as e:
-                logger.debug(f"Regex extraction with encoding {encoding} failed: {e}")
-                continue
+                logger.error(f"Error closing tracker {self.csv_path}: {e}")
+            self._fh = None
+            self._writer = None
+        self._unflushed = 0
 
-        logger.error("Failed to extract URLs using all methods")
-        return []
 
+class SqliteDownloadTracker(DownloadTracker):
+    """Download tracker persisted in an indexed SQLite table.
 
-class DownloadTracker:
-    """Track download progress and avoid duplicate downloads."""
+    URLs live in ``id2url.sqlite`` next to the CSV, keyed by a primary-key
+    index, so startup does not load them and ``is_processed`` is an indexed
+    lookup. An existing ``id2url.csv`` is imported the first time the
+    database is created.
+    """
 
-    CSV_FILENAME = "id2url.csv"
+    DB_FILENAME = "id2url.sqlite"
 
     def __init__(self, csv_path: Path) -> None:
-        """Initialize tracker with CSV file path.
+        """Initialize tracker next to the given CSV path.
 
         Args:
-            csv_path: Path to the tracking CSV file.
+            csv_path: Path of the legacy tracking CSV; the database is created
+                alongside it.
         """
-        self.csv_path = csv_path
-        self.existing_urls: set[str] = set()
-        self._load_existing_urls()
+        self.db_path = csv_path.with_name(self.DB_FILENAME)
+        self._conn: sqlite3.Connection | None = None
+        super().__init__(csv_path)
+
+    @property
+    def urls_in_memory(self) -> bool:
+        return False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS downloads (url TEXT PRIMARY KEY, path TEXT)"
+            )
+        return self._conn
 
     def _load_existing_urls(self) -> None:
-        """Load existing URLs from CSV file."""
-        if self.csv_path.exists():
-            try:
+        """Open the database, importing the legacy CSV if the table is new."""
+        try:
+            is_new = not self.db_path.exists()
+            conn = self._connect()
+            if is_new and self.csv_path.exists():
                 with open(self.csv_path, "r", newline="", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    self.existing_urls = {
-                        row["url"] for row in reader if row.get("url")
-                    }
-                logger.info(f"Loaded {len(self.existing_urls)} existing URLs")
-            except Exception as e:
-                logger.warning(f"Error loading existing URLs: {e}")
-
-        self._ensure_csv_exists()
-
-    def _ensure_csv_exists(self) -> None:
-        """Create CSV file with headers if it doesn't exist."""
-        if not self.csv_path.exists():
-            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["url", "Video Path"])
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO downloads (url, path) VALUES (?, ?)",
+                        (
+                            (row["url"], row.get("Video Path", ""))
+                            for row in csv.DictReader(f)
+                            if row.get("url")
+                        ),
+                    )
+                conn.commit()
+            (count,) = conn.execute("SELECT COUNT(*) FROM downloads").fetchone()
+            logger.info(f"Tracking {count} existing URLs in {self.db_path}")
+        except Exception as e:
+            logger.warning(f"Error opening tracker database: {e}")
 
     def is_processed(self, url: str) -> bool:
         """Check if URL has already been processed.
@@ -299,23 +345,48 @@ class DownloadTracker:
         Returns:
             True if URL was already processed.
         """
-        return url in self.existing_urls
+        row = self._connect().execute(
+            "SELECT 1 FROM downloads WHERE url = ? LIMIT 1", (url,)
+        ).fetchone()
+        return row is not None
 
     def record_download(self, url: str, video_path: str) -> None:
-        """Record a successful download to the CSV.
+        """Record a successful download in the database.
 
         Args:
             url: The downloaded video URL.
             video_path: Path where video was saved.
         """
         try:
-            with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([url, video_path])
-            self.existing_urls.add(url)
-            logger.debug(f"Recorded download: {url}")
+            self._connect().execute(
+                "INSERT OR IGNORE INTO downloads (url, path) VALUES (?, ?)",
+                (url, video_path),
+            )
+
+            self._unflushed += 1
+            if self._unflushed >= self.FLUSH_EVERY:
+                self.flush()
+
+            logger.debug("Recorded download: %s", url)
         except Exception as e:
-            logger.error(f"Error recording download: {e}")
+            logger.error("Error recording download: %s", e)
+
+    def flush(self) -> None:
+        """Commit pending inserts."""
+        if self._conn is not None:
+            self._conn.commit()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Commit and close the connection; it is reopened on next use."""
+        if self._conn is not None:
+            try:
+                self._conn.commit()
+                self._conn.close()
+            except Exception as e:
+                logger.error(f"Error closing tracker {self.db_path}: {e}")
+            self._conn = None
+        self._unflushed = 0
 
 
 @dataclass
@@ -327,7 +398,9 @@ class DownloadConfig:
         output_path: Directory to save downloaded videos.
         max_videos_per_folder: Maximum videos per subfolder.
         max_retries: Maximum download retry attempts.
-        retry_delay: Delay between retries in seconds.
+        retry_delay: Base delay in seconds for jittered exponential backoff.
+        max_concurrency: Maximum number of downloads in flight at once.
+        tracker_backend: Progress store per subfolder, "csv" or "sqlite".
     """
 
     input_path: Path
@@ -335,6 +408,15 @@ class DownloadConfig:
     max_videos_per_folder: int = 100
     max_retries: int = 3
     retry_delay: int = 5
+    max_concurrency: int = 16
+    tracker_backend: Literal["csv", "sqlite"] = "csv"
+
+    def __post_init__(self) -> None:
+        # 0 会让线程池直接报错、负数含义不明，在创建下载器前就拒绝
+        if self.max_concurrency <= 0:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {self.max_concurrency}"
+            )
 
 
 class TikTokBatchDownloader:
@@ -347,8 +429,33 @@ class TikTokBatchDownloader:
             config: Download configuration.
         """
         self.config = config
-        self.collector = TikTokVideoCollector()
+        # 所有 TikTok URL 同属一个 host，按下载并发数放开单 host 上限
+        self.collector = TikTokVideoCollector(
+            max_concurrent_per_host=config.max_concurrency
+        )
         self.url_extractor = URLExtractor()
+        # 按子文件夹缓存 tracker，每个 id2url.csv 只解析一次
+        self._trackers: dict[Path, DownloadTracker] = {}
+
+    def _get_tracker(self, subfolder_path: Path) -> DownloadTracker:
+        """Return the cached tracker for a subfolder, loading it on first use.
+
+        Args:
+            subfolder_path: Subfolder holding the tracking CSV.
+
+        Returns:
+            DownloadTracker bound to the subfolder's CSV.
+        """
+        tracker = self._trackers.get(subfolder_path)
+        if tracker is None:
+            tracker_cls = (
+                SqliteDownloadTracker
+                if self.config.tracker_backend == "sqlite"
+                else DownloadTracker
+            )
+            tracker = tracker_cls(subfolder_path / DownloadTracker.CSV_FILENAME)
+            self._trackers[subfolder_path] = tracker
+        return tracker
 
     def download_all(self) -> dict[str, Any]:
         """Download all videos from the configured URL list.
@@ -369,49 +476,74 @@ class TikTokBatchDownloader:
             logger.error("No valid URLs found")
             return {"success": False, "error": "No URLs found", "downloaded": 0, "failed": 0}
 
-        logger.info(f"Found {len(url_list)} URLs to download")
+        # 去重并保持顺序；子文件夹按去重后的位置分配，重跑时分配保持稳定
+        url_list = list(dict.fromkeys(url_list))
+        logger.info(f"Found {len(url_list)} unique URLs to download")
 
         # Create output directory
         self.config.output_path.mkdir(parents=True, exist_ok=True)
 
-        # Download videos
-        # 初始化 tracker map（按子文件夹缓存，避免重复加载 CSV）
-        tracker_cache: dict[Path, DownloadTracker] = {}
+        # 一次性创建全部子文件夹，下载循环内不再逐 URL mkdir
+        per_folder = self.config.max_videos_per_folder
+        folder_count = -(-len(url_list) // per_folder)
+        subfolders = [
+            self.config.output_path / f"video{i}" for i in range(1, folder_count + 1)
+        ]
+        for subfolder_path in subfolders:
+            subfolder_path.mkdir(exist_ok=True)
+        trackers = [self._get_tracker(subfolder_path) for subfolder_path in subfolders]
 
-        def get_tracker(subfolder_path: Path) -> DownloadTracker:
-            if subfolder_path not in tracker_cache:
-                tracker_cache[subfolder_path] = DownloadTracker(
-                    subfolder_path / DownloadTracker.CSV_FILENAME
-                )
-            return tracker_cache[subfolder_path]
+        # 一次性汇总所有已下载 URL，跨子文件夹跳过；Bloom/SQLite tracker 逐条查询
+        all_done: set[str] = set().union(*(t.existing_urls for t in trackers))
+        lookup_trackers = [t for t in trackers if not t.urls_in_memory]
 
         downloaded_count = 0
         failed_count = 0
+        skipped_count = 0
+        pending: list[tuple[str, Path, DownloadTracker]] = []
 
         for index, url in enumerate(url_list):
-            subfolder_index = (index // self.config.max_videos_per_folder) + 1
-            subfolder_path = (
-                self.config.output_path / f"video{subfolder_index}"
-            )
-            subfolder_path.mkdir(exist_ok=True)
+            if url in all_done or any(t.is_processed(url) for t in lookup_trackers):
+                skipped_count += 1
+                continue
 
-            tracker = get_tracker(subfolder_path)
+            folder_index = index // per_folder
+            pending.append((url, subfolders[folder_index], trackers[folder_index]))
 
-            if tracker.is_processed(url):
-                logger.info(f"Skipping already processed: {url}")
-                continue
+        if skipped_count:
+            logger.info(f"Skipping {skipped_count} already processed URLs")
 
-            result = self._download_single(url, subfolder_path)
-            if result["success"]:
-                tracker.record_download(url, result["video_path"])
-                downloaded_count += 1
-            else:
-                failed_count += 1
+        # 并发下载；结果在主线程中按完成顺序写入 tracker，无需额外加锁
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+                futures = {
+                    executor.submit(self._download_single, url, subfolder_path): (url, tracker)
+                    for url, subfolder_path, tracker in pending
+                }
+
+                for future in as_completed(futures):
+                    url, tracker = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error("Unexpected error downloading %s: %s", url, e)
+                        result = {"success": False, "error": str(e)}
+
+                    if result["success"]:
+                        tracker.record_download(url, result["video_path"])
+                        downloaded_count += 1
+                    else:
+                        failed_count += 1
+        finally:
+            for tracker in self._trackers.values():
+                tracker.close()
+            self.collector.close()
 
         summary = {
             "success": True,
             "downloaded": downloaded_count,
             "failed": failed_count,
+            "skipped": skipped_count,
             "total": len(url_list),
         }
 
@@ -430,14 +562,18 @@ class TikTokBatchDownloader:
         """
         for attempt in range(self.config.max_retries):
             try:
-                logger.info(f"Downloading (attempt {attempt + 1}): {url}")
+                logger.info("Downloading (attempt %s): %s", attempt + 1, url)
 
                 video, metadata = self.collector.collect(url, output_path)
 
                 if video:
-                    logger.info(f"Success: {metadata.id}")
-                    print(metadata)
-                    print(f"video download path: {video.downloaded_path}")
+                    # 一条日志记录输出全部信息：handler 加锁写出，并发下载时不会交错
+                    logger.info(
+                        "Success: %s\n%s\nvideo download path: %s",
+                        metadata.id,
+                        metadata,
+                        video.downloaded_path,
+                    )
 
                     return {
                         "success": True,
@@ -446,15 +582,14 @@ class TikTokBatchDownloader:
                     }
 
             except TikTokDownloadError as e:
-                logger.warning(f"Download attempt {attempt + 1} failed: {e}")
+                logger.warning("Download attempt %s failed: %s", attempt + 1, e)
 
                 if attempt < self.config.max_retries - 1:
-                    import time
-
-                    logger.info(f"Retrying in {self.config.retry_delay} seconds...")
-                    time.sleep(self.config.retry_delay)
+                    delay = backoff_delay(attempt, self.config.retry_delay)
+                    logger.info("Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
                 else:
-                    logger.error(f"Failed after {self.config.max_retries} attempts: {url}")
+                    logger.error("Failed after %s attempts: %s", self.config.max_retries, url)
 
         return {"success": False, "error": "Max retries exceeded"}
 
@@ -515,7 +650,21 @@ Examples:
         "--retry-delay",
         type=int,
         default=5,
-        help="Delay between retries in seconds (default: 5)",
+        help="Base retry delay in seconds, backed off exponentially with jitter (default: 5)",
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of concurrent downloads (default: 16)",
+    )
+
+    parser.add_argument(
+        "--tracker-backend",
+        choices=["csv", "sqlite"],
+        default="csv",
+        help="Per-folder download progress store (default: csv)",
     )
 
     return parser.parse_args()
@@ -525,13 +674,19 @@ def main() -> None:
     """Main entry point for the TikTok batch downloader."""
     args = parse_arguments()
 
-    config = DownloadConfig(
-        input_path=args.input,
-        output_path=args.output,
-        max_videos_per_folder=args.max_videos,
-        max_retries=args.max_retries,
-        retry_delay=args.retry_delay,
-    )
+    try:
+        config = DownloadConfig(
+            input_path=args.input,
+            output_path=args.output,
+            max_videos_per_folder=args.max_videos,
+            max_retries=args.max_retries,
+            retry_delay=args.retry_delay,
+            max_concurrency=args.max_concurrency,
+            tracker_backend=args.tracker_backend,
+        )
+    except ValueError as e:
+        logger.error(f"Invalid configuration: {e}")
+        raise SystemExit(2) from e
 
     downloader = TikTokBatchDownloader(config)
     summary = downloader.download_all()
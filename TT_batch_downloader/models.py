@@ -1,26 +1,42 @@
 """
 Data models for VideoAudit AI TikTok video downloader.
+
+Models declare ``__slots__`` explicitly (rather than ``slots=True``, which
+needs Python 3.10) so instances carry no per-object ``__dict__``.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any
 
 
 @dataclass(frozen=True)
 class MediaItem:
     """Base class for media items with a string ID."""
 
+    __slots__ = ("id",)
+
     id: str
 
     def __str__(self) -> str:
         return f"ID: {self.id}"
 
+    # Frozen + __slots__ needs explicit state hooks for copy/pickle
+    def __getstate__(self) -> list[Any]:
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
 
 @dataclass(frozen=True)
 class Metadata(MediaItem):
     """TikTok video metadata."""
 
+    __slots__ = ("title", "length", "views", "author", "description", "publish_date")
+
     title: str
     length: int
     views: int
@@ -29,13 +45,15 @@ class Metadata(MediaItem):
     publish_date: str
 
     def __str__(self) -> str:
-        return (
-            f"{super().__str__()}\n"
-            f"title: {self.title}\n"
-            f"length: {self.length}\n"
-            f"views: {self.views}\n"
-            f"author: {self.author}\n"
-            f"publish_date: {self.publish_date}"
+        return "\n".join(
+            (
+                f"ID: {self.id}",
+                f"title: {self.title}",
+                f"length: {self.length}",
+                f"views: {self.views}",
+                f"author: {self.author}",
+                f"publish_date: {self.publish_date}",
+            )
         )
 
 
@@ -43,7 +61,9 @@ class Metadata(MediaItem):
 class Video(MediaItem):
     """A downloaded TikTok video file."""
 
+    __slots__ = ("downloaded_path",)
+
     downloaded_path: str
 
     def __str__(self) -> str:
-        return f"{super().__str__()}\ndownloaded_path: {self.downloaded_path}"
+        return f"ID: {self.id}\ndownloaded_path: {self.downloaded_path}"
@@ -7,12 +7,20 @@ from TikTok URLs using the yt-dlp library.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
+import random
+import sqlite3
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from pathlib import Path
-from typing import Callable, Literal
+from typing import Any, Callable, Iterable, Literal
+from urllib.parse import urlparse
 
 import yt_dlp
 
@@ -41,33 +49,123 @@ class RateLimitError(TikTokDownloadError):
     pass
 
 
-def rate_limit(delay: float) -> Callable:
-    """Decorator to rate-limit method calls on a per-instance basis.
+class TokenBucket:
+    """Thread-safe token bucket.
 
-    Uses the instance's own state so different collector instances don't
-    interfere with each other's timing.
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts of up to ``capacity`` calls pass immediately and sustained
+    traffic is held to ``rate`` calls per second.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: int = 4) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of stored tokens (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available and take it.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        start = time.monotonic()
+        with self._cond:
+            self._refill()
+            while self._tokens < 1:
+                self._cond.wait((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+            # 令牌可能仍有剩余，唤醒下一个等待者
+            self._cond.notify()
+        return time.monotonic() - start
+
+
+class _HostLimit:
+    """Rate and concurrency limits for a single host."""
+
+    def __init__(self, rate: float, capacity: int, max_concurrent: int) -> None:
+        self.bucket = TokenBucket(rate=rate, capacity=capacity)
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+
+
+def rate_limit(
+    rate: float = 1.0,
+    capacity: int = 4,
+    max_concurrent_per_host: int = 4,
+) -> Callable:
+    """Decorator to rate-limit URL-taking methods per target host.
+
+    The first positional argument after ``self`` must be the URL. Limits are
+    kept per instance: calls to the same hostname share one token bucket and
+    at most ``max_concurrent_per_host`` of them run at once, while calls to
+    different hosts never wait on each other. An instance attribute of the
+    same name overrides the cap, so callers can match it to their own
+    worker count.
+
+    Args:
+        rate: Sustained calls per second allowed per host.
+        capacity: Burst size per host.
+        max_concurrent_per_host: Default maximum in-flight calls per host.
     """
 
     def decorator(func: Callable) -> Callable:
-        attr_name = f"_rate_limit_last_{func.__name__}"
+        limits: weakref.WeakKeyDictionary[Any, dict[str, _HostLimit]] = (
+            weakref.WeakKeyDictionary()
+        )
+        limits_lock = threading.Lock()
+
+        def get_limit(owner: Any, host: str) -> _HostLimit:
+            with limits_lock:
+                host_limits = limits.setdefault(owner, {})
+                limit = host_limits.get(host)
+                if limit is None:
+                    max_concurrent = getattr(
+                        owner, "max_concurrent_per_host", max_concurrent_per_host
+                    )
+                    limit = host_limits[host] = _HostLimit(rate, capacity, max_concurrent)
+                return limit
 
         @wraps(func)
-        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-            last = getattr(self, attr_name, 0.0)
-            elapsed = time.time() - last
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                logger.debug(f"Rate limiting {func.__name__}: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-            result = func(self, *args, **kwargs)
-            setattr(self, attr_name, time.time())
-            return result
+        def wrapper(self: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+            limit = get_limit(self, urlparse(str(url)).hostname or "")
+            with limit.slots:
+                waited = limit.bucket.acquire()
+                if waited > 0.01:
+                    logger.debug("Rate limiting %s: waited %.2fs", func.__name__, waited)
+                return func(self, url, *args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
+def backoff_delay(attempt: int, base: float, cap: float = 30.0) -> float:
+    """Return a full-jitter exponential backoff delay for a retry attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed.
+        base: Base delay in seconds.
+        cap: Upper bound on the backoff window in seconds.
+
+    Returns:
+        Delay in seconds drawn uniformly from ``[0, min(cap, base * 2**attempt)]``.
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
 class TikTokVideoCollector:
     """Collects TikTok video data and downloads videos.
 
@@ -76,12 +174,15 @@ class TikTokVideoCollector:
     """
 
     DEFAULT_DOWNLOAD_PATH = Path("videos")
+    # Extensions a finished download may have, in order of preference
+    VIDEO_EXTENSIONS = (".mp4", ".webm", ".mkv")
 
     def __init__(
         self,
         cookies_path: str | None = None,
         use_browser_cookies: bool = False,
         rate_limit_delay: float = 1.0,
+        max_concurrent_per_host: int = 4,
     ) -> None:
         """Initialize the TikTok video collector.
 
@@ -89,12 +190,76 @@ class TikTokVideoCollector:
             cookies_path: Path to cookies file for authenticated requests.
             use_browser_cookies: Whether to use browser cookies.
             rate_limit_delay: Delay in seconds between downloads to avoid rate limiting.
+            max_concurrent_per_host: Maximum :meth:`collect` calls in flight per
+                host. Every TikTok URL shares one host, so set this to the
+                caller's worker count or the extra workers just wait.
+
+        Raises:
+            ValueError: If max_concurrent_per_host is less than 1.
         """
+        if max_concurrent_per_host < 1:
+            raise ValueError(
+                f"max_concurrent_per_host must be at least 1, got {max_concurrent_per_host}"
+            )
         self.cookies_path = cookies_path
         self.use_browser_cookies = use_browser_cookies
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrent_per_host = max_concurrent_per_host
+        # Checked once here rather than on every options build
+        self._cookies_file_exists = bool(cookies_path) and Path(cookies_path).exists()
+        # Directories already created by this collector
+        self._ensured_dirs: set[Path] = set()
+
+        # YoutubeDL is not thread-safe, so each worker thread keeps its own
+        # instance, rebuilt only when its download path changes.
+        self._ydl_local = threading.local()
+        self._ydl_instances: set[yt_dlp.YoutubeDL] = set()
+        self._ydl_lock = threading.Lock()
+
+    def __enter__(self) -> TikTokVideoCollector:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-    @rate_limit(delay=1.0)
+    def _get_ydl(self, download_path: Path) -> yt_dlp.YoutubeDL:
+        """Return the calling thread's YoutubeDL for a download path.
+
+        Args:
+            download_path: Directory the instance should download into.
+
+        Returns:
+            A YoutubeDL configured for ``download_path``.
+        """
+        local = self._ydl_local
+        if getattr(local, "download_path", None) != download_path:
+            previous = getattr(local, "ydl", None)
+            if previous is not None:
+                with self._ydl_lock:
+                    self._ydl_instances.discard(previous)
+                previous.__exit__(None, None, None)
+
+            local.ydl = yt_dlp.YoutubeDL(self._get_ydl_options(download_path))
+            local.download_path = download_path
+            with self._ydl_lock:
+                self._ydl_instances.add(local.ydl)
+
+        return local.ydl
+
+    def close(self) -> None:
+        """Release all pooled YoutubeDL instances (saving cookies)."""
+        with self._ydl_lock:
+            instances = list(self._ydl_instances)
+            self._ydl_instances.clear()
+            self._ydl_local = threading.local()
+
+        for ydl in instances:
+            try:
+                ydl.__exit__(None, None, None)
+            except Exception as e:
+                logger.warning("Error closing YoutubeDL instance: %s", e)
+
+    @rate_limit(rate=1.0, capacity=4, max_concurrent_per_host=4)
     def collect(
         self,
         url: str,
@@ -116,7 +281,7 @@ class TikTokVideoCollector:
             RateLimitError: If rate limit is hit.
             TikTokDownloadError: For other download errors.
         """
-        logger.info(f"Starting collection for video URL: {url}")
+        logger.info("Starting collection for video URL: %s", url)
 
         if progress_callback:
             progress_callback(url, 0)
@@ -126,73 +291,135 @@ class TikTokVideoCollector:
             download_path = self.DEFAULT_DOWNLOAD_PATH
 
         download_path = Path(download_path)
-        download_path.mkdir(parents=True, exist_ok=True)
-
-        # Configure yt-dlp options
-        ydl_opts = self._get_ydl_options(download_path)
+        if download_path not in self._ensured_dirs:
+            download_path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(download_path)
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                if progress_callback:
-                    progress_callback(url, 25)
+            # Reuse this thread's YoutubeDL instead of rebuilding it per URL
+            ydl = self._get_ydl(download_path)
 
-                # Extract video info and download
-                info = ydl.extract_info(url, download=True)
+            if progress_callback:
+                progress_callback(url, 25)
 
-                if info is None:
-                    raise VideoNotFoundError(f"Video not found: {url}")
+            # Extract video info and download
+            info = ydl.extract_info(url, download=True)
 
-                if progress_callback:
-                    progress_callback(url, 75)
+            if info is None:
+                raise VideoNotFoundError(f"Video not found: {url}")
 
-                # Build video path
-                video_filename = f"{info['id']}.mp4"
-                video_path = download_path / video_filename
+            if progress_callback:
+                progress_callback(url, 75)
 
-                # Verify file exists
-                if not video_path.exists():
-                    # Try alternative extension
-                    video_path = download_path / f"{info['id']}.webm"
-                    if not video_path.exists():
-                        raise TikTokDownloadError(
-                            f"Video file not found after download: {info['id']}"
-                        )
-
-                # Create Video and Metadata objects
-                video_obj = Video(
-                    id=info["id"],
-                    downloaded_path=str(video_path),
+            # Locate the downloaded file with a single directory scan
+            video_path = self._find_downloaded_file(download_path, info["id"])
+            if video_path is None:
+                raise TikTokDownloadError(
+                    f"Video file not found after download: {info['id']}"
                 )
 
-                metadata = Metadata(
-                    id=info["id"],
-                    title=info.get("title", "N/A"),
-                    length=info.get("duration", 0),
-                    views=info.get("view_count", 0),
-                    author=info.get("uploader", "N/A"),
-                    description=info.get("description", ""),
-                    publish_date=info.get("upload_date", "N/A"),
-                )
+            # Create Video and Metadata objects
+            video_obj = Video(
+                id=info["id"],
+                downloaded_path=str(video_path),
+            )
 
-                logger.info(f"Collection successful for video ID: {info['id']}")
+            metadata = Metadata(
+                id=info["id"],
+                title=info.get("title", "N/A"),
+                length=info.get("duration", 0),
+                views=info.get("view_count", 0),
+                author=info.get("uploader", "N/A"),
+                description=info.get("description", ""),
+                publish_date=info.get("upload_date", "N/A"),
+            )
 
-                if progress_callback:
-                    progress_callback(url, 100)
+            logger.info("Collection successful for video ID: %s", info["id"])
 
-                return video_obj, metadata
+            if progress_callback:
+                progress_callback(url, 100)
+
+            return video_obj, metadata
 
         except yt_dlp.utils.DownloadError as e:
             error_msg = str(e).lower()
             if "rate limit" in error_msg or "too many requests" in error_msg:
-                logger.error(f"Rate limit hit for {url}: {e}")
+                logger.error("Rate limit hit for %s: %s", url, e)
                 raise RateLimitError(f"Rate limit exceeded: {e}") from e
-            logger.error(f"Download error for {url}: {e}")
+            logger.error("Download error for %s: %s", url, e)
             raise VideoNotFoundError(f"Failed to download video: {e}") from e
 
         except Exception as e:
-            logger.error(f"Unexpected error during collection: {e}")
+            logger.error("Unexpected error during collection: %s", e)
             raise TikTokDownloadError(f"Collection failed: {e}") from e
 
+    async def collect_many(
+        self,
+        urls: Iterable[str],
+        download_path: str | Path | None = None,
+        concurrency: int = 8,
+    ) -> dict[str, tuple[Video, Metadata] | TikTokDownloadError]:
+        """Collect many TikTok URLs concurrently.
+
+        yt-dlp is synchronous, so each :meth:`collect` call runs on a worker
+        thread; an ``asyncio.Semaphore`` caps how many are in flight, and
+        ``max_concurrent_per_host`` further caps calls to any one host.
+
+        Args:
+            urls: TikTok video URLs.
+            download_path: Directory to save downloaded videos.
+            concurrency: Maximum number of concurrent downloads.
+
+        Returns:
+            Mapping of URL to its (Video, Metadata) result, or to the
+            TikTokDownloadError raised for it.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+            async def collect_one(
+                url: str,
+            ) -> tuple[str, tuple[Video, Metadata] | TikTokDownloadError]:
+                async with semaphore:
+                    try:
+                        result = await loop.run_in_executor(
+                            executor, self.collect, url, download_path
+                        )
+                    except TikTokDownloadError as e:
+                        return url, e
+                    if result is None:
+                        return url, VideoNotFoundError(f"Video not found: {url}")
+                    return url, result
+
+            pairs = await asyncio.gather(*(collect_one(url) for url in urls))
+
+        return dict(pairs)
+
+    def _find_downloaded_file(self, download_path: Path, video_id: str) -> Path | None:
+        """Find the file yt-dlp wrote for a video ID.
+
+        Args:
+            download_path: Directory the video was downloaded into.
+            video_id: yt-dlp video ID (the output filename stem).
+
+        Returns:
+            Path of the downloaded video, or None if none was found.
+        """
+        prefix = f"{video_id}."
+        with os.scandir(download_path) as entries:
+            candidates = {
+                entry.name[len(video_id):]: entry.path
+                for entry in entries
+                if entry.name.startswith(prefix)
+            }
+
+        for ext in self.VIDEO_EXTENSIONS:
+            if ext in candidates:
+                return Path(candidates[ext])
+        return None
+
     def _get_ydl_options(self, download_path: Path) -> dict[str, Any]:
         """Build yt-dlp options dictionary.
 
@@ -210,9 +437,9 @@ class TikTokVideoCollector:
         }
 
         # Add cookies if configured
-        if self.cookies_path and Path(self.cookies_path).exists():
+        if self._cookies_file_exists:
             opts["cookies"] = self.cookies_path
-            logger.debug(f"Using cookies from: {self.cookies_path}")
+            logger.debug("Using cookies from: %s", self.cookies_path)
 
         elif self.use_browser_cookies:
             opts["cookiesfrombrowser"] = ("chrome",)
@@ -221,6 +448,102 @@ class TikTokVideoCollector:
         return opts
 
 
+class MetadataCache:
+    """Persistent LRU cache of yt-dlp metadata keyed by URL.
+
+    Entries live in a SQLite table and expire after ``ttl`` seconds; once the
+    table holds more than ``max_entries`` rows the least recently used ones
+    are evicted. Safe to share between threads.
+
+    There is no default location: callers pass a path, typically inside the
+    output folder, so nothing is written to the working directory.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 3000,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite file to store metadata in.
+            ttl: Seconds after which a cached entry is refetched.
+            max_entries: Maximum number of URLs kept in the cache.
+        """
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "url TEXT PRIMARY KEY, json BLOB, fetched_at REAL, used_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS metadata_used_at ON metadata (used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return cached metadata for a URL, or None on a miss or expiry.
+
+        Args:
+            url: Video URL.
+
+        Returns:
+            The cached info dictionary, or None.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json, fetched_at FROM metadata WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                return None
+            self._conn.execute(
+                "UPDATE metadata SET used_at = ? WHERE url = ?", (now, url)
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, url: str, info: dict[str, Any]) -> None:
+        """Store metadata for a URL, evicting the oldest entries if full.
+
+        Args:
+            url: Video URL.
+            info: JSON-serializable info dictionary.
+        """
+        now = time.time()
+        payload = json.dumps(info, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (url, json, fetched_at, used_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, payload.encode("utf-8"), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM metadata WHERE url IN ("
+                "SELECT url FROM metadata ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM metadata")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 # Legacy compatibility - keep old class name
 class TikTokDataCollector:
     """Legacy base class for backward compatibility.
@@ -228,21 +551,44 @@ class TikTokDataCollector:
     Deprecated: Use TikTokVideoCollector directly.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, metadata_cache: MetadataCache | None = None) -> None:
+        """Initialize the legacy collector.
+
+        Args:
+            metadata_cache: Optional cache for metadata lookups; without one
+                every lookup hits the network.
+        """
         logger.warning(
             "TikTokDataCollector is deprecated. Use TikTokVideoCollector instead."
         )
-        pass
+        self.metadata_cache = metadata_cache
+
+    def clear_metadata_cache(self) -> None:
+        """Drop all cached metadata so the next lookups hit the network."""
+        if self.metadata_cache is not None:
+            self.metadata_cache.clear()
 
     def get_video_data(self, url: str) -> dict[str, Any] | None:
         """Fetch video data using yt_dlp without downloading.
 
+        Results are served from the metadata cache, if one was given, when a
+        fresh entry exists.
+
         Args:
             url: The TikTok video URL.
 
         Returns:
             Dictionary containing video information or None on failure.
         """
+        if self.metadata_cache is not None:
+            try:
+                cached = self.metadata_cache.get(url)
+                if cached is not None:
+                    logger.debug("Metadata cache hit: %s", url)
+                    return cached
+            except Exception as e:
+                logger.warning("Metadata cache read failed for %s: %s", url, e)
+
         try:
             ydl_opts = {
                 "format": "bestvideo+bestaudio/best",
@@ -252,7 +598,17 @@ class TikTokDataCollector:
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 video_info = ydl.extract_info(url, download=False)
-                return video_info
+                if video_info is None:
+                    return None
+                # sanitize_info drops non-JSON-serializable internals
+                video_info = ydl.sanitize_info(video_info)
+
+            if self.metadata_cache is not None:
+                try:
+                    self.metadata_cache.put(url, video_info)
+                except Exception as e:
+                    logger.warning("Metadata cache write failed for %s: %s", url, e)
+            return video_info
 
         except Exception as e:
             logger.error(f"Error fetching video data: {e}")
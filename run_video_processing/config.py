@@ -8,7 +8,8 @@ no placeholder defaults are accepted at runtime.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -18,7 +19,12 @@ VIDEO_EXTENSIONS: Final[tuple[str, ...]] = (".mp4", ".avi", ".mov", ".mkv", ".fl
 MAX_VIDEO_SIZE_MB: Final[int] = 500
 API_TIMEOUT_SECONDS: Final[int] = 300
 MAX_RETRIES: Final[int] = 3
+GEMINI_REQUESTS_PER_MINUTE: Final[int] = 60
+GEMINI_TOKENS_PER_MINUTE: Final[int] = 1_000_000
+# Rough Gemini cost of one second of video (frames + audio), for budgeting
+GEMINI_TOKENS_PER_VIDEO_SECOND: Final[int] = 300
 DEFAULT_GEMINI_MODEL: Final[str] = "gemini-2.5-flash-preview-05-20"
+DEFAULT_KEY_PATH: Final[str] = "key.json"
 
 # Sentinel — used to detect missing env vars (distinct from any valid value)
 _UNSET: Final = object()
@@ -66,20 +72,35 @@ class AppConfig:
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Build a validated config from environment variables."""
-        key_path = Path(os.getenv("GOOGLE_KEY_PATH", "key.json")).expanduser()
+        env = os.environ
+        key_path = Path(env.get("GOOGLE_KEY_PATH", DEFAULT_KEY_PATH)).expanduser()
 
-        project_id = os.getenv("GEMINI_PROJECT_ID", "")
-        location = os.getenv("GEMINI_LOCATION", "")
+        project_id = env.get("GEMINI_PROJECT_ID", "")
+        location = env.get("GEMINI_LOCATION", "")
 
         return cls(key_path=key_path, project_id=project_id, location=location)
 
 
 # ── Legacy module-level helpers (deprecated) ───────────────────────────────────
 
-KEY_PATH: Final = os.getenv("GOOGLE_KEY_PATH", "key.json")
+KEY_PATH: Final = os.getenv("GOOGLE_KEY_PATH", DEFAULT_KEY_PATH)
 """Deprecated — use AppConfig.from_env() instead."""
 
+DEFAULT_GEMINI_PROJECT_ID: Final = os.getenv("GEMINI_PROJECT_ID", "")
+"""Deprecated — use AppConfig.from_env() instead."""
+
+DEFAULT_GEMINI_LOCATION: Final = os.getenv("GEMINI_LOCATION", "")
+"""Deprecated — use AppConfig.from_env() instead."""
+
+GEMINI_GCS_BUCKET: Final = os.getenv("GEMINI_GCS_BUCKET", "")
+"""Optional bucket for staging videos sent to Vertex AI (needs the ``gcs`` extra)."""
 
+
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
-    """Convenience wrapper: return a fully-validated AppConfig instance."""
+    """Convenience wrapper: return a fully-validated AppConfig instance.
+
+    The config is built and validated once per process; call
+    ``get_config.cache_clear()`` to pick up changed environment variables.
+    """
     return AppConfig.from_env()
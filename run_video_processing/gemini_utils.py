@@ -7,20 +7,75 @@ Google's Gemini multimodal AI model.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import re
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Final, Iterable, Iterator, Literal, TypeVar, cast
 
 from google import genai
 from google.genai import types
 
-from run_video_processing.config import DEFAULT_GEMINI_MODEL, MAX_RETRIES
+try:  # optional: only needed when GEMINI_GCS_BUCKET is set
+    from google.cloud import storage as gcs_storage
+except ImportError:
+    gcs_storage = None
+
+from run_video_processing.config import (
+    API_TIMEOUT_SECONDS,
+    DEFAULT_GEMINI_MODEL,
+    GEMINI_GCS_BUCKET,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_TOKENS_PER_MINUTE,
+    GEMINI_TOKENS_PER_VIDEO_SECOND,
+    MAX_RETRIES,
+    MAX_VIDEO_SIZE_MB,
+)
+from TT_batch_downloader.tiktok_data_collector import backoff_delay
 
 logger = logging.getLogger(__name__)
 
+# Substrings of lower-cased error messages that indicate throttling
+_RATE_LIMIT_MARKERS: Final = ("rate limit", "quota", "resource_exhausted", "429")
+
+# Upper bound for a single retry sleep
+MAX_BACKOFF_SECONDS: Final = 60.0
+
+_DEFAULT_LABELS: Final = ("不合格",) * 4
+# Four hyphen-separated labels. (?<!不) stops a match starting at the 合格
+# inside 不合格, and the lookahead rejects a fifth label after the chain;
+# extract_labels() rejects one before it
+_LABEL_RE: Final = re.compile(
+    r"(?<!不)(合格|不合格)\s*-\s*(合格|不合格)\s*-\s*(合格|不合格)\s*-\s*(合格|不合格)(?!\s*-)"
+)
+# Unicode-aware \w keeps CJK characters, matching the old str.isalnum() check
+_UNSAFE_FILENAME_RE: Final = re.compile(r"[^\w\-]")
+
+
+def extract_labels(response: str) -> tuple[str, str, str, str] | None:
+    """Find the four dimension labels in a Gemini response.
+
+    One compiled pass tolerates surrounding whitespace, prose or markdown.
+
+    Args:
+        response: Raw response string from Gemini API.
+
+    Returns:
+        The four labels in order, or None if no valid label line is present.
+    """
+    for match in _LABEL_RE.finditer(response):
+        # A "-" before the match means it is the tail of a longer chain
+        if response[: match.start()].rstrip().endswith("-"):
+            continue
+        return match.groups()  # type: ignore[return-value]
+    return None
+
 
 # Custom exceptions
 class GeminiError(Exception):
@@ -41,6 +96,12 @@ class GeminiAuthenticationError(GeminiError):
     pass
 
 
+class GeminiFileTooLargeError(GeminiError):
+    """Raised when a video exceeds MAX_VIDEO_SIZE_MB; never retried."""
+
+    pass
+
+
 @dataclass
 class LabelResult:
     """Structured result from video labeling.
@@ -74,26 +135,14 @@ class LabelResult:
         Raises:
             ValueError: If response format is invalid.
         """
-        # Clean up response
-        cleaned = response.strip()
-
-        # Try to parse labels separated by hyphens
-        labels = [label.strip() for label in cleaned.split("-")]
-
-        # Validate we have 4 labels
-        if len(labels) != 4:
-            logger.warning(f"Expected 4 labels, got {len(labels)}: {labels}")
+        labels = extract_labels(response)
+        if labels is None:
+            logger.warning(f"No valid label line in response: {response.strip()[:100]!r}")
             # Default to unqualified if format is wrong
-            labels = ["不合格", "不合格", "不合格", "不合格"]
-
-        # Validate each label
-        for i, label in enumerate(labels):
-            if label not in ["合格", "不合格"]:
-                logger.warning(f"Invalid label '{label}', defaulting to 不合格")
-                labels[i] = "不合格"
+            labels = _DEFAULT_LABELS
 
         # Calculate final score
-        final_score = "合格" if all(label == "合格" for label in labels) else "不合格"
+        final_score = "合格" if labels.count("合格") == 4 else "不合格"
 
         return cls(
             dimension_1=labels[0],  # type: ignore
@@ -118,23 +167,62 @@ class LabelResult:
         ]
         # Sanitize for filename
         safe = "-".join(parts).replace(" ", "_")
-        return "".join(
-            c if c.isalnum() or c in "-_" else "_" for c in safe
-        )
+        return _UNSAFE_FILENAME_RE.sub("_", safe)
+
 
+class GeminiRateLimiter:
+    """Async token bucket sized to the Gemini requests-per-minute quota.
 
-def retry_on_gemini_failure(max_retries: int = MAX_RETRIES, delay: float = 1.0):
+    Tokens refill at ``rpm / 60`` per second up to ``rpm``, so callers that
+    ``await acquire()`` before each request stay under the quota without a
+    fixed sleep between calls. Create it inside the running event loop.
+    """
+
+    def __init__(self, rpm: int = GEMINI_REQUESTS_PER_MINUTE) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rpm: Allowed requests per minute.
+        """
+        self.rate = rpm / 60.0
+        self.capacity = float(rpm)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def retry_on_gemini_failure(
+    max_retries: int = MAX_RETRIES, delay: float = 1.0
+) -> Callable[[_F], _F]:
     """Decorator to retry Gemini API calls on failure.
 
     Args:
         max_retries: Maximum number of retry attempts.
-        delay: Base delay between retries in seconds (exponential backoff).
+        delay: Base delay between retries in seconds (jittered exponential
+            backoff).
 
     Returns:
         Decorated function with retry logic.
     """
 
-    def decorator(func):
+    def decorator(func: _F) -> _F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
@@ -143,16 +231,22 @@ def retry_on_gemini_failure(max_retries: int = MAX_RETRIES, delay: float = 1.0):
                 try:
                     return func(*args, **kwargs)
 
+                except GeminiFileTooLargeError:
+                    # Retrying cannot make the file smaller
+                    raise
+
                 except Exception as e:
                     last_exception = e
                     error_msg = str(e).lower()
 
-                    # Check for rate limit errors
-                    if "rate limit" in error_msg or "quota" in error_msg:
+                    # Check for rate limit errors (incl. 429 RESOURCE_EXHAUSTED)
+                    if any(marker in error_msg for marker in _RATE_LIMIT_MARKERS):
                         logger.warning(f"Rate limit hit on attempt {attempt + 1}")
                         if attempt < max_retries - 1:
-                            sleep_time = delay * (2**attempt)
-                            logger.info(f"Retrying in {sleep_time}s...")
+                            sleep_time = backoff_delay(
+                                attempt, delay, MAX_BACKOFF_SECONDS
+                            )
+                            logger.info(f"Retrying in {sleep_time:.1f}s...")
                             time.sleep(sleep_time)
                             continue
 
@@ -165,10 +259,10 @@ def retry_on_gemini_failure(max_retries: int = MAX_RETRIES, delay: float = 1.0):
 
                     # Other errors
                     if attempt < max_retries - 1:
-                        sleep_time = delay * (2**attempt)
+                        sleep_time = backoff_delay(attempt, delay, MAX_BACKOFF_SECONDS)
                         logger.warning(
                             f"Attempt {attempt + 1} failed: {e}, "
-                            f"retrying in {sleep_time}s..."
+                            f"retrying in {sleep_time:.1f}s..."
                         )
                         time.sleep(sleep_time)
                     else:
@@ -177,7 +271,7 @@ def retry_on_gemini_failure(max_retries: int = MAX_RETRIES, delay: float = 1.0):
             # All retries failed
             raise GeminiError(f"API call failed: {last_exception}") from last_exception
 
-        return wrapper
+        return cast(_F, wrapper)
 
     return decorator
 
@@ -196,6 +290,12 @@ DEFAULT_ANALYSIS_PROMPT = """
 合格/不合格-合格/不合格-合格/不合格-合格/不合格
 """
 
+# Identifies the prompt/model combination cached labels were produced with;
+# changing either invalidates earlier cache entries automatically.
+PROMPT_VERSION: Final = hashlib.sha256(
+    f"{DEFAULT_GEMINI_MODEL}\n{DEFAULT_ANALYSIS_PROMPT}".encode("utf-8")
+).hexdigest()[:16]
+
 
 def setup_gemini_client(
     project_id: str, location: str, model: str = DEFAULT_GEMINI_MODEL
@@ -212,7 +312,14 @@ def setup_gemini_client(
 
     Raises:
         GeminiAuthenticationError: If client setup fails.
+        GeminiError: If GEMINI_GCS_BUCKET is set without google-cloud-storage.
     """
+    # Fail at startup rather than on (and retrying) every video
+    if GEMINI_GCS_BUCKET and gcs_storage is None:
+        raise GeminiError(
+            "GEMINI_GCS_BUCKET is set but google-cloud-storage is not installed"
+        )
+
     try:
         client = genai.Client(
             vertexai=True,
@@ -220,6 +327,11 @@ def setup_gemini_client(
             location=location,
         )
         logger.info(f"Gemini client initialized: project={project_id}, location={location}")
+        if not GEMINI_GCS_BUCKET:
+            logger.warning(
+                "GEMINI_GCS_BUCKET is not set: each video is read fully into "
+                "memory and sent inline"
+            )
         return client
 
     except Exception as e:
@@ -227,6 +339,78 @@ def setup_gemini_client(
         raise GeminiAuthenticationError(f"Client setup failed: {e}") from e
 
 
+def _complete_label_line(text: str) -> str | None:
+    """Return the first line of a streamed response if it is a full label line.
+
+    Args:
+        text: Response text received so far.
+
+    Returns:
+        The first non-empty line when it is terminated by a newline and holds
+        exactly four valid labels, otherwise None.
+    """
+    line, newline, _ = text.lstrip().partition("\n")
+    if not newline:
+        return None
+    if _LABEL_RE.fullmatch(line.strip()):
+        return line
+    return None
+
+
+# Seconds between File API state checks while an upload is processed
+FILE_POLL_INTERVAL = 2.0
+
+
+def _wait_for_file_active(client: genai.Client, uploaded: types.File) -> types.File:
+    """Poll an uploaded file until the File API marks it ACTIVE.
+
+    Args:
+        client: Configured Gemini API client.
+        uploaded: File handle returned by ``client.files.upload``.
+
+    Returns:
+        The refreshed file handle in the ACTIVE state.
+
+    Raises:
+        GeminiError: If processing fails or does not finish in time.
+    """
+    name = uploaded.name
+    if not name:
+        raise GeminiError("Uploaded file has no name to poll")
+
+    deadline = time.monotonic() + API_TIMEOUT_SECONDS
+    while uploaded.state == types.FileState.PROCESSING:
+        if time.monotonic() > deadline:
+            raise GeminiError(f"Timed out waiting for file {name} to process")
+        time.sleep(FILE_POLL_INTERVAL)
+        uploaded = client.files.get(name=name)
+
+    if uploaded.state == types.FileState.FAILED:
+        raise GeminiError(f"File processing failed: {uploaded.name}")
+
+    return uploaded
+
+
+@lru_cache(maxsize=1)
+def _gcs_bucket(name: str) -> Any:
+    """Return a handle to the GCS staging bucket, sharing one storage client."""
+    assert gcs_storage is not None  # checked in setup_gemini_client
+    return gcs_storage.Client().bucket(name)
+
+
+def _stage_video_in_gcs(video_path: Path) -> Any:
+    """Upload a video to GEMINI_GCS_BUCKET and return the blob.
+
+    ``upload_from_filename`` sends the file in chunks, so it is never read
+    into memory as a whole. The caller deletes the blob when done.
+    """
+    blob = _gcs_bucket(GEMINI_GCS_BUCKET).blob(
+        f"videoaudit/{uuid.uuid4().hex}/{video_path.name}"
+    )
+    blob.upload_from_filename(str(video_path), content_type="video/mp4")
+    return blob
+
+
 @retry_on_gemini_failure(max_retries=MAX_RETRIES, delay=1.0)
 def label_video_with_gemini(
     client: genai.Client,
@@ -246,6 +430,7 @@ def label_video_with_gemini(
         LabelResult with structured analysis results.
 
     Raises:
+        GeminiFileTooLargeError: If the video exceeds MAX_VIDEO_SIZE_MB.
         GeminiError: If analysis fails.
         FileNotFoundError: If video file doesn't exist.
     """
@@ -256,24 +441,47 @@ def label_video_with_gemini(
 
     logger.info(f"Analyzing video: {video_path.name}")
 
-    try:
-        # Read video file
-        with open(video_path, "rb") as f:
-            video_data = f.read()
+    # 读取/上传前通过 stat 检查大小，超限直接失败
+    file_size_mb = video_path.stat().st_size / (1024 * 1024)
+    if file_size_mb > MAX_VIDEO_SIZE_MB:  # Gemini has limits on file size
+        raise GeminiFileTooLargeError(
+            f"Video file is too large ({file_size_mb:.1f}MB > "
+            f"{MAX_VIDEO_SIZE_MB}MB): {video_path.name}"
+        )
 
-        # Check file size
-        file_size_mb = len(video_data) / (1024 * 1024)
-        if file_size_mb > 500:  # Gemini has limits on file size
-            logger.warning(
-                f"Video file is large ({file_size_mb:.1f}MB), "
-                f"may exceed API limits"
+    uploaded = None
+    staged_blob = None
+    try:
+        if getattr(client, "vertexai", False) and GEMINI_GCS_BUCKET:
+            # The File API is Gemini Developer API only; Vertex AI reads the
+            # video from a gs:// URI instead
+            staged_blob = _stage_video_in_gcs(video_path)
+            video_part = types.Part.from_uri(
+                file_uri=f"gs://{GEMINI_GCS_BUCKET}/{staged_blob.name}",
+                mime_type="video/mp4",
+            )
+        elif getattr(client, "vertexai", False):
+            # No staging bucket: Vertex AI only takes the video inline, which
+            # holds the whole file in memory for the duration of the call
+            video_part = types.Part.from_bytes(
+                data=video_path.read_bytes(),
+                mime_type="video/mp4",
+            )
+        else:
+            # Stream the file to the File API instead of buffering it in RAM
+            uploaded = client.files.upload(
+                file=str(video_path),
+                config=types.UploadFileConfig(mime_type="video/mp4"),
+            )
+            uploaded = _wait_for_file_active(client, uploaded)
+            if not uploaded.uri:
+                raise GeminiError(f"Uploaded file has no URI: {uploaded.name}")
+
+            # Create video part referencing the uploaded file
+            video_part = types.Part.from_uri(
+                file_uri=uploaded.uri,
+                mime_type=uploaded.mime_type,
             )
-
-        # Create video part
-        video_part = types.Part.from_bytes(
-            data=video_data,
-            mime_type="video/mp4",
-        )
 
         # Create text part with prompt
         text_part = types.Part.from_text(text=prompt)
@@ -295,20 +503,28 @@ def label_video_with_gemini(
             response_modalities=["TEXT"],
         )
 
-        # Call API with streaming
-        response_text = ""
+        # Call API with streaming; stop as soon as a complete label line
+        # has arrived instead of waiting for any trailing explanation
+        chunks: list[str] = []
+        label_line = None
         for chunk in client.models.generate_content_stream(
             model=model,
             contents=contents,
             config=generate_content_config,
         ):
             if chunk.text:
-                response_text += chunk.text
+                chunks.append(chunk.text)
+                if "\n" in chunk.text:
+                    label_line = _complete_label_line("".join(chunks))
+                    if label_line is not None:
+                        break
+
+        response_text = "".join(chunks)
 
         logger.info(f"Gemini response received: {response_text[:100]}...")
 
         # Parse response into structured result
-        result = LabelResult.parse_from_response(response_text)
+        result = LabelResult.parse_from_response(label_line or response_text)
 
         return result
 
@@ -319,3 +535,222 @@ def label_video_with_gemini(
     except Exception as e:
         logger.error(f"Gemini API call failed: {e}")
         raise GeminiError(f"Video analysis failed: {e}") from e
+    finally:
+        if uploaded is not None and uploaded.name:
+            try:
+                client.files.delete(name=uploaded.name)
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded file {uploaded.name}: {e}")
+        if staged_blob is not None:
+            try:
+                staged_blob.delete()
+            except Exception as e:
+                logger.warning(f"Failed to delete staged video {staged_blob.name}: {e}")
+
+
+def label_videos_batch(
+    client: genai.Client,
+    video_paths: Iterable[str | Path],
+    max_workers: int = 8,
+    prompt: str = DEFAULT_ANALYSIS_PROMPT,
+    model: str = DEFAULT_GEMINI_MODEL,
+) -> Iterator[tuple[Path, LabelResult | Exception]]:
+    """Label many videos concurrently on a bounded thread pool.
+
+    Uploads and streaming calls spend their time waiting on the network, so
+    one shared client can serve several worker threads at once.
+
+    Args:
+        client: Configured Gemini API client, shared by all workers.
+        video_paths: Video files to analyze.
+        max_workers: Maximum number of videos in flight.
+        prompt: Analysis prompt to send to Gemini.
+        model: Gemini model name to use.
+
+    Yields:
+        ``(path, result)`` pairs in completion order, where ``result`` is the
+        LabelResult or the exception raised for that video.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(label_video_with_gemini, client, path, prompt, model): Path(path)
+            for path in video_paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result()
+            except Exception as e:
+                logger.error(f"Labeling failed for {path.name}: {e}")
+                yield path, e
+
+
+async def label_video_with_gemini_async(
+    client: genai.Client,
+    video_path: str | Path,
+    prompt: str = DEFAULT_ANALYSIS_PROMPT,
+    model: str = DEFAULT_GEMINI_MODEL,
+) -> LabelResult:
+    """Async variant of :func:`label_video_with_gemini`.
+
+    The upload (or, on Vertex AI without a staging bucket, the whole-file
+    read), streaming call and retry sleeps are all blocking, so the whole
+    call runs on the default executor via ``asyncio.to_thread``, leaving
+    the event loop free to drive other videos concurrently.
+
+    Args:
+        client: Configured Gemini API client.
+        video_path: Path to the video file to analyze.
+        prompt: Analysis prompt to send to Gemini.
+        model: Gemini model name to use.
+
+    Returns:
+        LabelResult with structured analysis results.
+    """
+    return await asyncio.to_thread(
+        label_video_with_gemini, client, video_path, prompt, model
+    )
+
+
+def estimate_video_tokens(
+    duration_seconds: float, prompt: str = DEFAULT_ANALYSIS_PROMPT
+) -> int:
+    """Estimate the prompt tokens a video of the given length will consume.
+
+    This is a budgeting heuristic, not a tokenizer count: the video costs
+    GEMINI_TOKENS_PER_VIDEO_SECOND per second, and the prompt one token per
+    character. The prompt is mostly Chinese, which Gemini tokenizes at about
+    a character per token or more, so this errs on the high side.
+
+    Args:
+        duration_seconds: Video duration in seconds.
+        prompt: Text prompt sent with the video.
+
+    Returns:
+        Estimated token count including the text prompt.
+    """
+    return int(duration_seconds * GEMINI_TOKENS_PER_VIDEO_SECOND) + len(prompt)
+
+
+class GeminiJobQueue:
+    """Queue of labelling jobs dispatched within Gemini's RPM and TPM quotas.
+
+    Worker coroutines take jobs from an ``asyncio.Queue`` and, before each
+    request, wait on both a :class:`GeminiRateLimiter` and a per-minute
+    token budget that a background task resets every 60 seconds. Create,
+    :meth:`start` and :meth:`drain` it inside one running event loop.
+
+    The blocking Gemini calls run on the queue's own thread pool, sized to
+    *concurrency*, so callers that block on :meth:`submit` from the loop's
+    default executor can never starve the workers of threads.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rpm: int = GEMINI_REQUESTS_PER_MINUTE,
+        tpm: int = GEMINI_TOKENS_PER_MINUTE,
+        prompt: str = DEFAULT_ANALYSIS_PROMPT,
+        model: str = DEFAULT_GEMINI_MODEL,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            concurrency: Number of requests allowed in flight.
+            rpm: Requests-per-minute quota.
+            tpm: Tokens-per-minute quota.
+            prompt: Analysis prompt to send to Gemini.
+            model: Gemini model name to use.
+        """
+        self.concurrency = concurrency
+        self.max_tpm = tpm
+        self.prompt = prompt
+        self.model = model
+        self.tokens_used_this_minute = 0
+        self._limiter = GeminiRateLimiter(rpm)
+        self._budget = asyncio.Condition()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="gemini-label"
+        )
+
+    def start(self) -> None:
+        """Spawn the worker coroutines and the budget reset task."""
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reset_budget()))
+
+    async def submit(
+        self, client: genai.Client, video_path: str | Path, estimated_tokens: int
+    ) -> LabelResult:
+        """Queue a video for labelling and wait for its result.
+
+        Args:
+            client: Configured Gemini API client.
+            video_path: Path to the video file to analyze.
+            estimated_tokens: Tokens to reserve from the per-minute budget.
+
+        Returns:
+            LabelResult for the video.
+
+        Raises:
+            GeminiError: If analysis fails.
+        """
+        future: asyncio.Future[LabelResult] = asyncio.get_running_loop().create_future()
+        await self._queue.put((client, video_path, estimated_tokens, future))
+        return await future
+
+    async def drain(self) -> None:
+        """Wait for queued jobs to finish, then stop the background tasks.
+
+        Also waits for any Gemini call still running on the queue's threads
+        (e.g. one whose caller was cancelled), without blocking the loop.
+        """
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def _reserve_tokens(self, tokens: int) -> None:
+        async with self._budget:
+            # A job larger than the whole budget still runs, alone, at the
+            # start of a fresh minute
+            await self._budget.wait_for(
+                lambda: self.tokens_used_this_minute + tokens <= self.max_tpm
+                or self.tokens_used_this_minute == 0
+            )
+            self.tokens_used_this_minute += tokens
+
+    async def _reset_budget(self) -> None:
+        while True:
+            await asyncio.sleep(60)
+            async with self._budget:
+                self.tokens_used_this_minute = 0
+                self._budget.notify_all()
+
+    async def _worker(self) -> None:
+        while True:
+            client, video_path, tokens, future = await self._queue.get()
+            try:
+                await self._reserve_tokens(tokens)
+                await self._limiter.acquire()
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    label_video_with_gemini,
+                    client,
+                    video_path,
+                    self.prompt,
+                    self.model,
+                )
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
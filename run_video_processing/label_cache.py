@@ -0,0 +1,115 @@
+"""
+Persistent cache of Gemini labels keyed by video content.
+
+A re-run, or a byte-identical duplicate under another name, is answered from
+the cache instead of re-uploading the video to Gemini.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class LabelCache:
+    """SQLite-backed map of ``(content hash, prompt version)`` → raw label.
+
+    File digests are cached too, keyed by ``(path, size, mtime)``, so an
+    unchanged file is not re-hashed on the next run. Safe to share between
+    threads.
+    """
+
+    DB_FILENAME = ".label_cache.sqlite"
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Open (or create) the cache database in a directory.
+
+        Args:
+            cache_dir: Directory holding the cache file.
+        """
+        self.db_path = Path(cache_dir) / self.DB_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS labels ("
+            "  digest TEXT, prompt_version TEXT, raw_label TEXT,"
+            "  PRIMARY KEY (digest, prompt_version));"
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "  path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT);"
+        )
+        self._conn.commit()
+
+    def file_digest(self, path: str | Path) -> str:
+        """Return the BLAKE2b digest of a file, reusing a cached one if unchanged.
+
+        Args:
+            path: File to hash.
+
+        Returns:
+            Hex digest of the file contents.
+        """
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM digests WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, st.st_size, st.st_mtime_ns),
+            ).fetchone()
+        if row is not None:
+            return row[0]
+
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashing loop runs in C over a reused buffer
+                h = hashlib.file_digest(f, hashlib.blake2b)
+            else:
+                h = hashlib.blake2b()
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                    h.update(chunk)
+        digest = h.hexdigest()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO digests (path, size, mtime_ns, digest) "
+                "VALUES (?, ?, ?, ?)",
+                (path, st.st_size, st.st_mtime_ns, digest),
+            )
+            self._conn.commit()
+        return digest
+
+    def get(self, digest: str, prompt_version: str) -> str | None:
+        """Return the cached raw label for a digest, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw_label FROM labels WHERE digest = ? AND prompt_version = ?",
+                (digest, prompt_version),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, digest: str, prompt_version: str, raw_label: str) -> None:
+        """Store the raw label for a digest."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO labels (digest, prompt_version, raw_label) "
+                "VALUES (?, ?, ?)",
+                (digest, prompt_version, raw_label),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every cached label (file digests are kept)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM labels")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,46 @@
 # run_video_processing/main.py
+import argparse
+import atexit
+import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from .video_labeler import label_entire_videos # 注意函数名已更改
 from . import config
 
+
+def _start_logging() -> QueueListener:
+    """日志记录先入队，由后台线程统一写到 stderr，工作线程不再阻塞在输出上"""
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="视频批量标注程序")
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="清空标签缓存，重新调用 Gemini 标注所有视频",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="重新处理上次运行已完成标注的视频",
+    )
+    args = parser.parse_args()
+
+    # sys.exit 时也会停止监听线程并写出剩余日志
+    atexit.register(_start_logging().stop)
+
     print("--- 视频批量标注程序 ---") # 更新程序名称
 
     key_path_from_config = config.KEY_PATH
@@ -37,33 +72,35 @@ if __name__ == "__main__":
     user_base_folder = os.path.join(project_root, 'user')
     user_specific_folder = os.path.join(user_base_folder, user_name)
 
-    if not os.path.exists(user_specific_folder):
-        try:
-            os.makedirs(user_specific_folder)
-            print(f"已为您创建好文件夹: {user_specific_folder}")
-            print("请传入待打标视频文件到相应的 'original_scene' 文件夹后重新运行程序。")
-            sys.exit(0)
-        except OSError as e:
-            print(f"错误：无法创建用户文件夹 {user_specific_folder}: {e}")
-            sys.exit(1)
-    else:
+    # 直接尝试创建，用 FileExistsError 判断是否已存在（无额外 stat，无竞态）
+    try:
+        os.makedirs(user_specific_folder)
+    except FileExistsError:
         print(f"用户文件夹 {user_specific_folder} 已存在，继续处理。")
+    except OSError as e:
+        print(f"错误：无法创建用户文件夹 {user_specific_folder}: {e}")
+        sys.exit(1)
+    else:
+        print(f"已为您创建好文件夹: {user_specific_folder}")
+        print("请传入待打标视频文件到相应的 'original_scene' 文件夹后重新运行程序。")
+        sys.exit(0)
 
     input_video_folder = os.path.join(user_specific_folder, 'original_scene')
     # 输出文件夹名可以保持不变，或者改为更通用的名字如 'Labeled_Videos'
     output_result_folder = os.path.join(user_specific_folder, 'Result_folder_labeled') # 可以改名
 
     for folder_path in [input_video_folder, output_result_folder]:
-        if not os.path.exists(folder_path):
-            try:
-                os.makedirs(folder_path)
-                print(f"已创建子文件夹: {folder_path}")
-                if folder_path == input_video_folder:
-                    print(f"请确保视频文件已放入 {input_video_folder} 中。")
-            except OSError as e:
-                print(f"错误：无法创建子文件夹 {folder_path}: {e}")
-                sys.exit(1)
-    
+        try:
+            os.makedirs(folder_path)
+        except FileExistsError:
+            continue
+        except OSError as e:
+            print(f"错误：无法创建子文件夹 {folder_path}: {e}")
+            sys.exit(1)
+        print(f"已创建子文件夹: {folder_path}")
+        if folder_path == input_video_folder:
+            print(f"请确保视频文件已放入 {input_video_folder} 中。")
+
     if not os.listdir(input_video_folder):
         print(f"提示：输入文件夹 {input_video_folder} 为空。请添加视频文件后再运行。")
         sys.exit(0)
@@ -78,6 +115,8 @@ if __name__ == "__main__":
         input_folder=input_video_folder,
         output_folder=output_result_folder,
         project_id=config.DEFAULT_GEMINI_PROJECT_ID,
-        location=config.DEFAULT_GEMINI_LOCATION
+        location=config.DEFAULT_GEMINI_LOCATION,
+        refresh_cache=args.refresh_cache,
+        force=args.force,
     )
-    print("--- 程序执行完毕 ---")
\ No newline at end of file
+    print("--- 程序执行完毕 ---")
@@ -1,161 +1,147 @@
 # run_video_processing/report_generator.py
+import asyncio
+import json
+import logging
 import os
+from collections import Counter
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from datetime import datetime
+
+from jinja2 import Environment, FileSystemLoader
+
 from .video_utils import format_duration_human
-import html # 用于HTML转义，防止XSS
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+REPORT_TEMPLATE = "report.html.j2"
+
+@dataclass(frozen=True)
+class ProcessedVideoInfo:
+    """单个已处理视频的报告信息 (固定字段，用属性访问代替 dict.get)"""
+
+    # 显式 __slots__ (slots=True 需要 Python 3.10)，大批量结果不带 __dict__
+    __slots__ = (
+        "original_filename",
+        "new_filename",
+        "label",
+        "gemini_raw",
+        "final_score",
+        "duration",
+        "file_size_mb",
+        "relative_video_path",
+    )
+
+    original_filename: str
+    new_filename: str
+    label: str
+    gemini_raw: str
+    final_score: str
+    duration: float
+    file_size_mb: float
+    relative_video_path: str
+
+    # frozen + __slots__ 没有 __dict__，copy/pickle 需要显式的状态钩子
+    def __getstate__(self):
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
+
+def json_default(obj):
+    """json.dump 的 default 回调：dataclass 转为 dict，其余转为字符串"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+# 按扩展名确定的 MIME 类型，未列出的扩展名直接使用 video/<ext>
+_MIME_TYPES = {".mp4": "video/mp4", ".webm": "video/webm", ".ogv": "video/ogg"}
+
+
+def _format_video_duration(duration):
+    """格式化单个视频时长 (秒)，非数值时原样输出"""
+    try:
+        if isinstance(duration, (int, float)):
+            return f"{duration:.2f} 秒"
+        return str(duration) # Fallback
+    except (ValueError, TypeError):
+        return "未知"
+
+
+def _video_mime_type(filename):
+    """从新文件名确定MIME类型，默认 video/mp4"""
+    video_ext = os.path.splitext(filename)[1].lower() if filename else ""
+    if not video_ext:
+        return "video/mp4"
+    return _MIME_TYPES.get(video_ext, f"video/{video_ext[1:]}")
+
+
+# 模板环境在模块加载时创建一次；autoescape 负责全部 HTML 转义，防止XSS
+_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=False,
+)
+_env.filters["duration"] = _format_video_duration
+_env.filters["video_mime_type"] = _video_mime_type
+
 
 def generate_html_report(results, output_dir, start_time, end_time):
     """生成HTML处理报告 (针对完整视频打标，增加最终得分和视频预览)"""
     html_path = os.path.join(output_dir, "processing_report.html")
-    
+    json_path = os.path.join(output_dir, "processing_report.json")
+
     total_processing_duration_seconds = end_time - start_time
     formatted_total_processing_duration = format_duration_human(total_processing_duration_seconds)
-    
+
     start_time_str = datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')
     end_time_str = datetime.fromtimestamp(end_time).strftime('%Y-%m-%d %H:%M:%S')
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="zh-CN">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>视频标注处理报告</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; color: #333; }}
-            .container {{ max-width: 1200px; margin: 0 auto; background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); }}
-            h1, h2, h3, h4 {{ color: #333; }}
-            .video-item {{ margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
-            .success {{ border-left: 5px solid #4CAF50; }}
-            .failed {{ border-left: 5px solid #F44336; }}
-            .summary {{ margin-bottom: 30px; padding: 15px; background-color: #e8f5e9; border-radius: 5px; }}
-            table {{ width: 100%; border-collapse: collapse; margin-top: 10px; margin-bottom: 15px; }}
-            th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; word-wrap: break-word; }}
-            th {{ background-color: #f2f2f2; font-weight: bold; }}
-            .time-info {{ background-color: #e3f2fd; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-            .video-player-container {{ margin-top: 15px; margin-bottom: 10px; }}
-            .video-player-container video {{ 
-                max-width: 100%; 
-                height: auto; 
-                border-radius: 4px; 
-                border: 1px solid #ccc; 
-            }}
-            .status-合格 {{ color: green; font-weight: bold; }}
-            .status-不合格 {{ color: red; font-weight: bold; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>视频标注处理报告</h1>
-            
-            <div class="time-info">
-                <h3>处理时间信息</h3>
-                <p>开始时间: {start_time_str}</p>
-                <p>结束时间: {end_time_str}</p>
-                <p>总处理时长: {formatted_total_processing_duration}</p>
-            </div>
-            
-            <div class="summary">
-                <h2>处理摘要</h2>
-                <p>总视频数: {len(results)}</p>
-                <p>成功处理: {sum(1 for r in results.values() if r['status'] == 'success')}</p>
-                <p>处理失败: {sum(1 for r in results.values() if r['status'] == 'failed')}</p>
-            </div>
-            
-            <h2>视频处理详情</h2>
-    """
-    
-    for video_name_orig, result in results.items(): # video_name_orig 是原始文件名
-        status_class_html = "success" if result["status"] == "success" else "failed"
-        video_name_html = html.escape(video_name_orig)
-        html_content += f"""
-            <div class="video-item {status_class_html}">
-                <h3>原始视频: {video_name_html}</h3>
-                <p>处理状态: <span class="status-{result["status"]}">{html.escape(result["status"])}</span></p>
-        """
-        
-        if result["status"] == "success" and result.get("processed_video_info"):
-            video_info = result["processed_video_info"]
-            html_content += """
-                <h4>已处理视频信息:</h4>
-                <table>
-                    <tr><th>项目</th><th>详情</th></tr>
-            """
-            try:
-                duration = video_info.get("duration", 0.0)
-                if isinstance(duration, (int, float)):
-                    formatted_duration_video = f"{duration:.2f} 秒"
-                else:
-                    formatted_duration_video = str(duration) # Fallback
-            except (ValueError, TypeError):
-                formatted_duration_video = "未知"
-
-            gemini_label_html = html.escape(video_info.get("label", "未标注"))
-            # 新增：获取并格式化最终得分
-            final_score = video_info.get("final_score", "不合格")
-            final_score_class = "status-合格" if final_score == "合格" else "status-不合格"
-            final_score_html = f'<span class="{final_score_class}">{html.escape(final_score)}</span>'
-            
-            new_filename_html = html.escape(video_info.get("new_filename", "未知"))
-
-            html_content += f"""
-                    <tr><td>Gemini 标签</td><td>{gemini_label_html}</td></tr>
-                    <tr><td>最终得分</td><td>{final_score_html}</td></tr>
-                    <tr><td>新文件名</td><td>{new_filename_html}</td></tr>
-                    <tr><td>时长</td><td>{formatted_duration_video}</td></tr>
-            """
-            html_content += "</table>"
-            
-            # 新增：视频播放器
-            relative_video_path = video_info.get("relative_video_path")
-            if relative_video_path:
-                # 路径已经被处理成用 '/' 分隔
-                safe_video_path = html.escape(relative_video_path) 
-                
-                # 从新文件名确定MIME类型
-                new_filename_for_ext = video_info.get("new_filename", "")
-                video_ext = ""
-                if new_filename_for_ext:
-                    video_ext = os.path.splitext(new_filename_for_ext)[1].lower()
-                
-                mime_type = "video/mp4" # 默认MIME类型
-                if video_ext == ".mp4": mime_type = "video/mp4"
-                elif video_ext == ".webm": mime_type = "video/webm"
-                elif video_ext == ".ogv": mime_type = "video/ogg"
-                elif video_ext: mime_type = f"video/{video_ext[1:]}" # 其他类型尝试直接使用
-
-                html_content += f"""
-                <div class="video-player-container">
-                    <h4>视频预览:</h4>
-                    <video width="560" height="315" controls preload="metadata">
-                        <source src="{safe_video_path}" type="{mime_type}">
-                        您的浏览器不支持播放此视频。尝试的视频类型: {html.escape(mime_type)}
-                    </video>
-                </div>
-                """
-            
-            output_dir_display = html.escape(result.get("output_dir", "未知"))
-            html_content += f"""
-                <p>已保存到处理子目录: {output_dir_display}</p>
-            """
-
-        elif result["status"] == "failed":
-            error_message_html = html.escape(result.get("error", "未知错误"))
-            html_content += f"""
-                <p>错误信息: {error_message_html}</p>
-            """
-        
-        html_content += "</div>" # video-item
-    
-    html_content += """
-        </div> <!-- container -->
-    </body>
-    </html>
-    """
-    
+
+    # 单次遍历统计成功/失败数量
+    status_counts = Counter(r["status"] for r in results.values())
+
+    context = {
+        "start_time_str": start_time_str,
+        "end_time_str": end_time_str,
+        "total_duration": formatted_total_processing_duration,
+        "total": len(results),
+        "success": status_counts["success"],
+        "failed": status_counts["failed"],
+        "results": results,
+    }
+
     try:
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        print(f"HTML报告已生成: {html_path}")
+        # 流式渲染，逐段写入文件，不在内存中拼出完整HTML
+        _env.get_template(REPORT_TEMPLATE).stream(context).dump(html_path, encoding="utf-8")
+        logger.info(f"HTML报告已生成: {html_path}")
     except Exception as e:
-        print(f"生成HTML报告失败: {e}")
\ No newline at end of file
+        logger.error(f"生成HTML报告失败: {e}")
+
+    # 同时输出JSON版本，供下游工具直接读取，无需解析HTML
+    try:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "start_time": start_time_str,
+                    "end_time": end_time_str,
+                    "total": len(results),
+                    "success": status_counts["success"],
+                    "failed": status_counts["failed"],
+                    "results": results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+                default=json_default,
+            )
+        logger.info(f"JSON报告已生成: {json_path}")
+    except Exception as e:
+        logger.error(f"生成JSON报告失败: {e}")
+
+
+async def generate_html_report_async(results, output_dir, start_time, end_time):
+    """generate_html_report 的异步版本：在线程中执行文件写入，不阻塞事件循环"""
+    await asyncio.to_thread(generate_html_report, results, output_dir, start_time, end_time)
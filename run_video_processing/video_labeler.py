@@ -5,27 +5,72 @@ and generates structured HTML/JSON reports.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 import re
 import shutil
+import sqlite3
+import threading
 import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+orjson: ModuleType | None
+try:  # 可选依赖：orjson 序列化更快，缺失时回退到标准库 json
+    import orjson
+except ImportError:
+    orjson = None
 
 from run_video_processing import config
 from run_video_processing.gemini_utils import (
     GeminiError,
+    GeminiJobQueue,
+    LabelResult,
+    PROMPT_VERSION,
+    estimate_video_tokens,
+    extract_labels,
     setup_gemini_client,
-    label_video_with_gemini,
 )
-from run_video_processing.video_utils import get_video_duration, format_duration_human
-from run_video_processing.report_generator import generate_html_report
+from run_video_processing.label_cache import LabelCache
+from run_video_processing.video_utils import (
+    format_duration_human,
+    VideoMetaCache,
+    get_video_duration,
+)
+from run_video_processing.report_generator import (
+    ProcessedVideoInfo,
+    generate_html_report,
+    json_default,
+)
+
+logger = logging.getLogger(__name__)
+
+VIDEO_META_CACHE_FILENAME = ".video_meta_cache.json"
+SUMMARY_WRITE_BUFFER = 1024 * 1024
+RESULTS_JSONL_FILENAME = "results.jsonl"
+# 每个视频输出子文件夹内的标注记录，用于再次运行时跳过已完成的视频
+LABEL_RECORD_FILENAME = "label.json"
+
+# 标注后的视频复制在独立线程池中进行，与 Gemini 调用重叠
+COPY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="label-copy")
 
 # 隐藏文件/元数据文件过滤
 _HIDDEN_RE = re.compile(r"^\.|^\._")
+# 文件名清洗（模块加载时编译一次）
+_NAME_CLEAN_RE = re.compile(r"[^\w\s\-_()\[\]]")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
 _SUPPORTED_EXTENSIONS = frozenset(
     ext.lower() for ext in config.VIDEO_EXTENSIONS
 )
+_DIM_NAMES = ("环境", "功能", "文案", "品牌")
+
+# 保证并发线程首次调用时只创建一个 Gemini 客户端
+_GEMINI_CLIENT_LOCK = threading.Lock()
 
 
 def _skip_hidden(filename: str) -> bool:
@@ -38,8 +83,13 @@ def _is_video(filename: str) -> bool:
 
 
 def _sanitize_filename_part(text: str, max_len: int = 80) -> str:
-    """Return a filename-safe string, stripped and truncated."""
-    cleaned = re.sub(r"[^\w\s\-_()\[\]]", "_", text).strip("_ ")
+    """Return a filename-safe string, stripped and truncated.
+
+    Spaces become underscores and runs of underscores collapse to one.
+    """
+    cleaned = _MULTI_UNDERSCORE_RE.sub(
+        "_", _NAME_CLEAN_RE.sub("_", text).replace(" ", "_")
+    ).strip("_")
     return cleaned[:max_len]
 
 
@@ -48,27 +98,32 @@ def _parse_gemini_label(raw: str) -> tuple[str, str]:
 
     Gemini 响应格式：合格/不合格-合格/不合格-合格/不合格-合格/不合格
     Returns (display_string, final_score) — final_score is "合格" or "不合格".
+    Labels are found the same way LabelResult finds them, so a response
+    with surrounding prose or markdown scores identically in both places.
     """
-    if not raw or raw in ("标签生成失败", "未标注"):
-        return raw, "不合格"
-
-    parts = [p.strip() for p in raw.split("-")]
-    if len(parts) != 4:
-        # 格式不符，降级为不合格
-        return raw, "不合格"
-
-    all_pass = all(p in ("合格", "不合格") for p in parts)
-    if not all_pass:
+    labels = extract_labels(raw) if raw else None
+    if labels is None:
+        # 格式不符（含"标签生成失败"/"未标注"），降级为不合格
         return raw, "不合格"
 
-    final = "合格" if all(p == "合格" for p in parts) else "不合格"
+    final = "合格" if labels.count("合格") == 4 else "不合格"
 
     # Human-readable display: 环境-功能-文案-品牌
-    dim_names = ["环境", "功能", "文案", "品牌"]
-    display = " / ".join(f"{dim_names[i]}:{parts[i]}" for i in range(4))
+    display = " / ".join(f"{name}:{label}" for name, label in zip(_DIM_NAMES, labels))
     return display, final
 
 
+@lru_cache(maxsize=1)
+def _gemini_client(project_id: str, location: str):
+    """Create the shared Gemini client on first use.
+
+    Failures are not cached, so the next video retries the setup.
+    """
+    client = setup_gemini_client(project_id, location)
+    logger.info(f"Gemini 客户端就绪 (project={project_id}, location={location})")
+    return client
+
+
 def _build_output_filename(
     original_name: str,
     display_label: str,
@@ -81,19 +136,386 @@ def _build_output_filename(
     return f"{base}-标签-{label_part}{ext}"
 
 
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy *size* bytes between descriptors without user-space buffers.
+
+    ``os.copy_file_range`` lets Btrfs/XFS share extents (reflink); otherwise
+    ``os.sendfile`` still keeps the data in the kernel.
+    """
+    copy = getattr(os, "copy_file_range", None)
+    offset = 0
+    while offset < size:
+        if copy is not None:
+            try:
+                sent = copy(src_fd, dst_fd, size - offset, offset, offset)
+            except OSError:
+                # e.g. EXDEV on older kernels — continue with sendfile
+                copy = None
+                continue
+        else:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _copy_labeled(src: Path, dst: Path) -> None:
+    """Place a video at its labelled destination as cheaply as possible.
+
+    A hard link is tried first (O(1), same filesystem only); otherwise the
+    bytes are copied inside the kernel, falling back to ``shutil.copy``
+    where that is unsupported (e.g. macOS) or fails. Only the bytes are
+    needed downstream, so timestamps and permissions are not copied.
+    """
+    try:
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+        return
+    except OSError:
+        # EXDEV (different filesystem), EPERM (no hard links), ...
+        pass
+
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                _kernel_copy(src_fd, dst_fd, os.fstat(src_fd).st_size)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def _load_label_record(record_path: Path, digest: str) -> ProcessedVideoInfo | None:
+    """Return a previous run's result if it still applies, else None.
+
+    It applies when the record was written for the same content digest and
+    prompt version and its labelled copy is still present.
+    """
+    try:
+        with open(record_path, "rb") as f:
+            record = json.load(f)
+        if (
+            record.get("digest") != digest
+            or record.get("prompt_version") != PROMPT_VERSION
+        ):
+            return None
+        info = ProcessedVideoInfo(**record["processed_video_info"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not (record_path.parent / info.new_filename).is_file():
+        return None
+    return info
+
+
+def _copy_and_record(
+    src: Path, dst: Path, record_path: Path | None, record: dict | None
+) -> None:
+    """Copy the labelled video, then write its label record (if any).
+
+    The record is written only after the copy succeeds, and atomically, so a
+    crash never leaves a record pointing at a partial copy.
+    """
+    _copy_labeled(src, dst)
+    if record_path is None:
+        return
+    tmp_path = record_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, default=json_default)
+    os.replace(tmp_path, record_path)
+
+
+def _process_video(
+    filename: str,
+    input_folder: Path,
+    output_folder: Path,
+    label_video: Callable[[Path, float], LabelResult] | None,
+    label_cache: LabelCache | None = None,
+    copy_pool: Executor | None = None,
+    file_size: int | None = None,
+    resume: bool = False,
+    meta_cache: VideoMetaCache | None = None,
+) -> tuple[dict, Future | None]:
+    """Label and copy one video; never raises (errors go into the entry).
+
+    *label_video(path, duration)* returns the Gemini label; None skips
+    labelling. With *resume*, a video whose label record (see
+    LABEL_RECORD_FILENAME) matches its content hash is skipped entirely.
+
+    With *copy_pool*, the copy is submitted there and its future returned so
+    the caller can free this video's slot before the bytes are written.
+    *file_size* may be passed in from a directory scan to skip a stat.
+    """
+    video_path = input_folder / filename
+    copy_future = None
+    result_entry: dict = {
+        "status": "failed",
+        "error": None,
+        "processed_video_info": None,
+        "output_dir": "",
+    }
+
+    try:
+        if file_size is None:
+            file_size = os.path.getsize(video_path)
+        if file_size == 0:
+            raise OSError(f"文件大小为 0: {filename}")
+
+        logger.info(f"[PROCESS] {filename} ({file_size / 1024 / 1024:.1f} MB)")
+
+        # ── 为当前视频创建独立输出子文件夹 ─────────────────
+        # 只拆分一次文件名，后续复用 base_name/ext
+        base_name, ext = os.path.splitext(filename)
+        video_output_dir = output_folder / base_name
+        video_output_dir.mkdir(parents=True, exist_ok=True)
+        result_entry["output_dir"] = str(video_output_dir)
+        record_path = video_output_dir / LABEL_RECORD_FILENAME
+
+        digest = None
+        if label_cache is not None:
+            try:
+                digest = label_cache.file_digest(video_path)
+            except (OSError, sqlite3.Error) as ce:
+                logger.warning(f"标签缓存读取失败 ({filename}): {ce}")
+
+        # ── 断点续跑：上次运行已完成且内容未变，直接复用结果 ─────
+        if resume and digest is not None:
+            previous = _load_label_record(record_path, digest)
+            if previous is not None:
+                logger.info(f"[RESUME] {filename} 已有标注结果，跳过")
+                result_entry["status"] = "success"
+                result_entry["processed_video_info"] = previous
+                return result_entry, None
+
+        # ── Gemini 标注 ───────────────────────────────────
+        raw_label = "未标注"
+        video_duration = get_video_duration(video_path, meta_cache)
+
+        # 内容相同的视频直接复用缓存标签，跳过 Gemini 调用
+        cached_label = None
+        if label_cache is not None and digest is not None:
+            try:
+                cached_label = label_cache.get(digest, PROMPT_VERSION)
+            except sqlite3.Error as ce:
+                logger.warning(f"标签缓存读取失败 ({filename}): {ce}")
+
+        if cached_label is not None:
+            raw_label = cached_label
+            logger.info(f"[CACHE] {filename} 使用缓存标签")
+        elif label_video is not None:
+            try:
+                label_result = label_video(video_path, video_duration)
+                raw_label = label_result.raw_response
+                # 格式不合法的回复不缓存，否则同一视频以后永远拿到错误标签
+                if (
+                    label_cache is not None
+                    and digest is not None
+                    and extract_labels(raw_label) is not None
+                ):
+                    label_cache.put(digest, PROMPT_VERSION, raw_label)
+            except GeminiError as ge:
+                logger.warning(f"Gemini 标注失败 ({filename}): {ge}")
+                raw_label = "标签生成失败"
+            except sqlite3.Error as ce:
+                logger.warning(f"标签缓存写入失败 ({filename}): {ce}")
+
+        # ── 解析标签 ───────────────────────────────────────
+        display_label, final_score = _parse_gemini_label(raw_label)
+
+        # ── 构建输出文件名 ────────────────────────────────
+        safe_filename = _build_output_filename(base_name, display_label, ext)
+        output_path = video_output_dir / safe_filename
+
+        # ── HTML 报告用相对路径（正斜杠） ─────────────────
+        rel_path = os.path.relpath(output_path, output_folder).replace(os.sep, "/")
+
+        info = ProcessedVideoInfo(
+            original_filename=filename,
+            new_filename=safe_filename,
+            label=display_label,
+            gemini_raw=raw_label,
+            final_score=final_score,
+            duration=video_duration,
+            file_size_mb=round(file_size / 1024 / 1024, 2),
+            relative_video_path=rel_path,
+        )
+
+        # 只为解析出四个标签的视频写记录，失败或格式错误的下次运行时重试
+        record = None
+        record_target: Path | None = None
+        if digest is not None and extract_labels(raw_label) is not None:
+            record = {
+                "digest": digest,
+                "prompt_version": PROMPT_VERSION,
+                "processed_video_info": info,
+            }
+            record_target = record_path
+
+        if copy_pool is not None:
+            copy_future = copy_pool.submit(
+                _copy_and_record, video_path, output_path, record_target, record
+            )
+        else:
+            _copy_and_record(video_path, output_path, record_target, record)
+
+        result_entry["status"] = "success"
+        result_entry["processed_video_info"] = info
+
+        logger.info(f"[OK]   → {safe_filename}  |  终评: {final_score}")
+
+    except OSError as e:
+        result_entry["error"] = f"OS错误: {e}"
+        logger.error(f"[FAIL] {filename} — {result_entry['error']}")
+
+    except Exception as e:
+        result_entry["error"] = f"处理异常: {e}"
+        logger.exception(f"[FAIL] {filename} — 未预期的错误: {e}")
+
+    finally:
+        logger.debug(f"[DONE] {filename}")
+
+    return result_entry, copy_future
+
+
+class _ResultsWriter:
+    """Append each finished video's result to a JSONL file as it completes.
+
+    Keeps a crash from losing every result gathered so far. Only the event
+    loop thread writes, so lines never interleave. With *append* (resumed
+    runs) earlier runs' lines are kept, and a later line for the same file
+    supersedes an earlier one.
+    """
+
+    FLUSH_EVERY = 10
+
+    def __init__(self, path: Path, append: bool = False) -> None:
+        self.path = path
+        # 句柄在整个批次期间保持打开，由 label_entire_videos 的 finally 关闭
+        mode = "ab" if append else "wb"
+        self._fh = open(path, mode, buffering=1 << 20)  # noqa: SIM115
+        self._unflushed = 0
+
+    def write(self, filename: str, entry: dict) -> None:
+        if orjson is not None:
+            line = orjson.dumps({filename: entry}, default=json_default)
+        else:
+            line = json.dumps(
+                {filename: entry}, ensure_ascii=False, default=json_default
+            ).encode("utf-8")
+        self._fh.write(line + b"\n")
+        self._unflushed += 1
+        if self._unflushed >= self.FLUSH_EVERY:
+            self._fh.flush()
+            self._unflushed = 0
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+async def _process_videos(
+    video_files: list[str],
+    input_folder: Path,
+    output_folder: Path,
+    project_id: str,
+    location: str,
+    max_concurrency: int,
+    label_cache: LabelCache | None = None,
+    file_sizes: dict[str, int] | None = None,
+    results_writer: _ResultsWriter | None = None,
+    resume: bool = False,
+    meta_cache: VideoMetaCache | None = None,
+) -> dict:
+    """Run _process_video for every file with at most *max_concurrency* in flight.
+
+    Each video's work (Gemini upload/labelling, duration probe) is blocking,
+    so it runs on a worker thread; the semaphore bounds how many overlap.
+    Gemini requests are handed back to the loop's GeminiJobQueue, which keeps
+    them under the per-minute request and token quotas. Labelled copies run
+    on COPY_POOL outside the semaphore.
+    Each finished entry is appended to *results_writer* immediately; the
+    returned dict keeps the input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    job_queue = GeminiJobQueue(concurrency=max_concurrency)
+    job_queue.start()
+
+    def label_video(video_path: Path, duration: float) -> LabelResult:
+        # 在工作线程中调用：首次需要时才创建客户端，再把任务交回事件循环排队
+        with _GEMINI_CLIENT_LOCK:
+            client = _gemini_client(project_id, location)
+        return asyncio.run_coroutine_threadsafe(
+            job_queue.submit(
+                client, video_path, estimate_video_tokens(duration, job_queue.prompt)
+            ),
+            loop,
+        ).result()
+
+    async def process_one(filename: str) -> tuple[str, dict]:
+        async with semaphore:
+            entry, copy_future = await asyncio.to_thread(
+                _process_video,
+                filename,
+                input_folder,
+                output_folder,
+                label_video,
+                label_cache,
+                COPY_POOL,
+                file_sizes.get(filename) if file_sizes else None,
+                resume,
+                meta_cache,
+            )
+
+        # 复制在 COPY_POOL 中进行，等待时不占用并发名额
+        if copy_future is not None:
+            try:
+                await asyncio.wrap_future(copy_future)
+            except OSError as e:
+                entry["status"] = "failed"
+                entry["processed_video_info"] = None
+                entry["error"] = f"OS错误: {e}"
+                logger.error(f"[FAIL] {filename} — {entry['error']}")
+
+        if results_writer is not None:
+            results_writer.write(filename, entry)
+        return filename, entry
+
+    try:
+        pairs = await asyncio.gather(*(process_one(f) for f in video_files))
+    finally:
+        await job_queue.drain()
+    return dict(pairs)
+
+
 def label_entire_videos(
     input_folder: str | Path,
     output_folder: str | Path,
     project_id: str = config.DEFAULT_GEMINI_PROJECT_ID,
     location: str = config.DEFAULT_GEMINI_LOCATION,
+    max_concurrency: int = 8,
+    refresh_cache: bool = False,
+    force: bool = False,
 ) -> dict:
     """Process all videos in *input_folder*, write labelled copies to *output_folder*.
 
+    Labels are cached in *output_folder* by video content hash, so unchanged
+    or duplicate videos are not sent to Gemini again, and videos a previous
+    run already finished are skipped unless *force* (or *refresh_cache*).
+
     Args:
         input_folder: Directory containing source videos.
         output_folder: Root output directory (one subfolder per video is created).
         project_id: Google Cloud project ID for Vertex AI.
         location: Google Cloud region.
+        max_concurrency: Maximum number of videos processed at once.
+        refresh_cache: Discard cached labels and re-label every video.
+        force: Re-process videos that a previous run already labelled.
 
     Returns:
         Summary dict with statistics.
@@ -104,114 +526,77 @@ def label_entire_videos(
     output_folder = Path(output_folder)
 
     if not input_folder.exists():
-        print(f"[ERROR] 输入文件夹不存在：{input_folder}")
+        logger.error(f"输入文件夹不存在：{input_folder}")
         return {"success": False, "results": {}}
 
     output_folder.mkdir(parents=True, exist_ok=True)
 
-    # ── Gemini 客户端初始化（一次） ────────────────────────────
-    gemini_client = None
-    try:
-        gemini_client = setup_gemini_client(project_id, location)
-        print(f"[INFO] Gemini 客户端就绪 (project={project_id}, location={location})")
-    except GeminiError as e:
-        print(f"[WARN] Gemini 客户端初始化失败: {e} — 继续跳过 AI 标注")
-
     # ── 扫描文件（提前过滤非法文件） ─────────────────────────
-    raw_files = os.listdir(input_folder)
-    video_files = [f for f in raw_files if not _skip_hidden(f) and _is_video(f)]
-    skipped = len(raw_files) - len(video_files)
-
-    print(f"[INFO] 发现 {len(video_files)} 个视频文件，跳过 {skipped} 个非视频/隐藏文件")
-
-    results: dict = {}
-    success_count = 0
-    fail_count = 0
-
-    # ── 逐文件处理 + 单文件级异常隔离 ─────────────────────────
-    for filename in video_files:
-        video_path = input_folder / filename
-        result_entry: dict = {
-            "status": "failed",
-            "error": None,
-            "processed_video_info": None,
-            "output_dir": "",
-        }
-
-        try:
-            file_size = os.path.getsize(video_path)
-            if file_size == 0:
-                raise OSError(f"文件大小为 0: {filename}")
-
-            print(f"\n[PROCESS] {filename} ({file_size / 1024 / 1024:.1f} MB)")
-
-            # ── 为当前视频创建独立输出子文件夹 ─────────────────
-            base_name = os.path.splitext(filename)[0]
-            video_output_dir = output_folder / base_name
-            video_output_dir.mkdir(parents=True, exist_ok=True)
-            result_entry["output_dir"] = str(video_output_dir)
-
-            # ── Gemini 标注 ───────────────────────────────────
-            raw_label = "未标注"
-            final_score = "不合格"
-            video_duration = get_video_duration(video_path)
-
-            if gemini_client:
-                try:
-                    label_result = label_video_with_gemini(gemini_client, video_path)
-                    raw_label = label_result.raw_response
-                    final_score = label_result.final_score
-                except GeminiError as ge:
-                    print(f"[WARN] Gemini 标注失败 ({filename}): {ge}")
-                    raw_label = "标签生成失败"
-
-            # ── 解析标签 ───────────────────────────────────────
-            display_label, final_score = _parse_gemini_label(raw_label)
-
-            # ── 构建输出文件名 ────────────────────────────────
-            ext = os.path.splitext(filename)[1]
-            safe_filename = _build_output_filename(base_name, display_label, ext)
-            output_path = video_output_dir / safe_filename
-
-            shutil.copy2(video_path, output_path)
-
-            # ── HTML 报告用相对路径（正斜杠） ─────────────────
-            rel_path = os.path.relpath(output_path, output_folder).replace(os.sep, "/")
-
-            result_entry["status"] = "success"
-            result_entry["processed_video_info"] = {
-                "original_filename": filename,
-                "new_filename": safe_filename,
-                "label": display_label,
-                "gemini_raw": raw_label,
-                "final_score": final_score,
-                "duration": video_duration,
-                "file_size_mb": round(file_size / 1024 / 1024, 2),
-                "relative_video_path": rel_path,
-            }
-
-            success_count += 1
-            print(f"[OK]   → {safe_filename}  |  终评: {final_score}")
-
-            # API 速率保护（每个视频间隔 1s）
-            if gemini_client:
-                time.sleep(1)
-
-        except OSError as e:
-            result_entry["error"] = f"OS错误: {e}"
-            print(f"[FAIL] {filename} — {result_entry['error']}")
-
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            result_entry["error"] = f"处理异常: {e}"
-            print(f"[FAIL] {filename} — 未预期的错误: {e}")
+    # 单次 scandir：is_file()/stat() 复用目录读取结果，避免逐个 stat
+    file_sizes: dict[str, int] = {}
+    raw_count = 0
+    with os.scandir(input_folder) as it:
+        for entry in it:
+            raw_count += 1
+            if _skip_hidden(entry.name) or not _is_video(entry.name):
+                continue
+            if entry.is_file():
+                file_sizes[entry.name] = entry.stat().st_size
+    video_files = sorted(file_sizes)
+    skipped = raw_count - len(video_files)
+
+    logger.info(f"发现 {len(video_files)} 个视频文件，跳过 {skipped} 个非视频/隐藏文件")
+
+    # ── 标签缓存（按视频内容哈希） ───────────────────────────
+    label_cache = None
+    try:
+        label_cache = LabelCache(output_folder)
+        if refresh_cache:
+            label_cache.clear()
+            logger.info("已清空标签缓存")
+    except sqlite3.Error as e:
+        logger.warning(f"标签缓存不可用: {e}")
+
+    # ── 视频元数据缓存（时长等，按路径/大小/修改时间） ─────────
+    meta_cache = VideoMetaCache(output_folder / VIDEO_META_CACHE_FILENAME)
+    meta_cache.load()
+
+    # ── 逐条写出结果（JSONL），崩溃时保留已完成部分 ───────────
+    # 续跑时追加，保留上次运行已写出的结果；--force/--refresh-cache 时重写
+    resume = not (force or refresh_cache)
+    results_writer = None
+    try:
+        results_writer = _ResultsWriter(
+            output_folder / RESULTS_JSONL_FILENAME, append=resume
+        )
+    except OSError as e:
+        logger.warning(f"无法创建结果日志: {e}")
 
-        finally:
-            results[filename] = result_entry
-            if result_entry["status"] == "failed":
-                fail_count += 1
-            print(f"[DONE] {filename}")
+    # ── 并发处理 + 单文件级异常隔离 ─────────────────────────
+    try:
+        results = asyncio.run(
+            _process_videos(
+                video_files,
+                input_folder,
+                output_folder,
+                project_id,
+                location,
+                max_concurrency,
+                label_cache,
+                file_sizes,
+                results_writer,
+                resume=resume,
+                meta_cache=meta_cache,
+            )
+        )
+    finally:
+        if results_writer is not None:
+            results_writer.close()
+        if label_cache is not None:
+            label_cache.close()
+        meta_cache.save()
+    success_count = sum(1 for r in results.values() if r["status"] == "success")
+    fail_count = len(results) - success_count
 
     # ── 生成报告 ──────────────────────────────────────────────
     end_time = time.time()
@@ -226,7 +611,7 @@ def label_entire_videos(
                 end_time,
             )
         except Exception as e:
-            print(f"[WARN] HTML 报告生成失败: {e}")
+            logger.warning(f"HTML 报告生成失败: {e}")
 
     # ── 写 JSON 摘要 ─────────────────────────────────────────
     summary = {
@@ -242,11 +627,18 @@ def label_entire_videos(
 
     summary_path = output_folder / "processing_summary.json"
     try:
-        with open(summary_path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=4, ensure_ascii=False)
-        print(f"\n[INFO] 摘要已保存: {summary_path}")
+        with open(summary_path, "wb", buffering=SUMMARY_WRITE_BUFFER) as f:
+            # orjson 只支持 2 空格缩进，标准库回退保持同样格式
+            if orjson is not None:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2, default=json_default))
+            else:
+                f.write(
+                    json.dumps(summary, indent=2, ensure_ascii=False, default=json_default)
+                    .encode("utf-8")
+                )
+        logger.info(f"摘要已保存: {summary_path}")
     except Exception as e:
-        print(f"[ERROR] 无法保存摘要: {e}")
+        logger.error(f"无法保存摘要: {e}")
 
-    print(f"\n✅ 处理完成！成功: {success_count}/{len(video_files)}，耗时: {total_duration}")
+    logger.info(f"✅ 处理完成！成功: {success_count}/{len(video_files)}，耗时: {total_duration}")
     return summary
@@ -2,14 +2,22 @@
 Video utility functions for VideoAudit AI.
 
 This module provides utilities for video duration calculation and time formatting.
+Durations and stream info come from ffprobe when it is installed, with
+OpenCV as the fallback.
 """
 
 from __future__ import annotations
 
 import contextlib
+import json
 import logging
+import os
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import cv2
 
@@ -47,10 +55,9 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string.
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
 
 
 def format_duration_human(seconds: float) -> str:
@@ -68,61 +75,252 @@ def format_duration_human(seconds: float) -> str:
     return f"{secs} s"
 
 
-def get_video_duration(video_path: str | Path) -> float:
+# ffprobe reads container headers only, far cheaper than opening the video
+# with OpenCV; None when it is not installed.
+_FFPROBE = shutil.which("ffprobe")
+FFPROBE_TIMEOUT_SECONDS = 30
+
+
+def _run_ffprobe(video_path: str, entries: str) -> dict[str, Any] | None:
+    """Run ffprobe and return its JSON output, or None if it is unavailable or fails."""
+    if _FFPROBE is None:
+        return None
+    try:
+        proc = subprocess.run(
+            [
+                _FFPROBE, "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", entries,
+                "-of", "json",
+                video_path,
+            ],
+            capture_output=True,
+            timeout=FFPROBE_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"ffprobe failed for {video_path}: {e}")
+        return None
+    if proc.returncode != 0:
+        return None
+    try:
+        return json.loads(proc.stdout)
+    except ValueError:
+        return None
+
+
+def _parse_rate(rate: str) -> float:
+    """Parse an ffprobe frame rate such as ``30000/1001``."""
+    num, _, den = rate.partition("/")
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _probe_duration(video_path: str) -> float:
+    """Read a video's duration; raises if it cannot be determined.
+
+    Uses ffprobe's container duration, falling back to OpenCV.
+    """
+    data = _run_ffprobe(video_path, "format=duration")
+    if data is not None:
+        try:
+            return float(data["format"]["duration"])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    with video_capture(video_path) as cap:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        if fps <= 0:
+            logger.warning(f"Invalid FPS for {video_path}: {fps}")
+            return 0.0
+
+        return frame_count / fps
+
+
+def _probe_info(video_path: str) -> dict[str, Any]:
+    """Read a video's stream properties; raises if they cannot be determined.
+
+    Uses ffprobe, falling back to OpenCV.
+    """
+    data = _run_ffprobe(
+        video_path, "stream=r_frame_rate,nb_frames,width,height:format=duration"
+    )
+    if data is not None and data.get("streams"):
+        stream = data["streams"][0]
+        fps = _parse_rate(stream.get("r_frame_rate", "0/1"))
+        width = int(stream.get("width", 0))
+        height = int(stream.get("height", 0))
+        try:
+            duration = float(data.get("format", {}).get("duration", 0.0))
+        except (TypeError, ValueError):
+            duration = 0.0
+        try:
+            frame_count = int(stream["nb_frames"])
+        except (KeyError, TypeError, ValueError):
+            # Some containers (e.g. webm) carry no frame count
+            frame_count = int(round(duration * fps))
+
+        return {
+            "fps": fps,
+            "frame_count": frame_count,
+            "width": width,
+            "height": height,
+            "duration": duration,
+            "resolution": f"{width}x{height}",
+        }
+
+    with video_capture(video_path) as cap:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        duration = 0.0
+        if fps > 0:
+            duration = frame_count / fps
+
+        return {
+            "fps": fps,
+            "frame_count": frame_count,
+            "width": width,
+            "height": height,
+            "duration": duration,
+            "resolution": f"{width}x{height}",
+        }
+
+
+_PROBES: dict[str, Callable[[str], Any]] = {
+    "duration": _probe_duration,
+    "info": _probe_info,
+}
+
+def _file_key(video_path: str | Path) -> tuple[str, int, int]:
+    st = os.stat(video_path)
+    return os.path.abspath(video_path), st.st_size, st.st_mtime_ns
+
+
+@lru_cache(maxsize=4096)
+def _cached_probe(kind: str, path: str, size: int, mtime_ns: int) -> Any:
+    """Run probe *kind* once per file version within this process.
+
+    Keyed on size and mtime so a modified file is probed again. Failed
+    probes raise and are therefore never cached.
+    """
+    return _PROBES[kind](path)
+
+
+class VideoMetaCache:
+    """Probe results persisted in one output folder (``.video_meta_cache.json``).
+
+    Entries are keyed ``"<path>|<size>|<mtime_ns>"``. Only entries looked up
+    since :meth:`load` are written back by :meth:`save`, so the file holds
+    exactly the videos of the latest run and stale versions drop out.
+    Safe to share between threads.
+    """
+
+    def __init__(self, cache_path: str | Path) -> None:
+        """Create an empty cache bound to a JSON file.
+
+        Args:
+            cache_path: JSON file read by :meth:`load` and written by :meth:`save`.
+        """
+        self.cache_path = Path(cache_path)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load entries persisted by a previous run, if any."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable video metadata cache {self.cache_path}: {e}")
+            return
+
+        with self._lock:
+            self._entries.update(data)
+
+    def save(self) -> None:
+        """Persist the entries used since :meth:`load`."""
+        with self._lock:
+            data = {key: self._entries[key] for key in self._used if key in self._entries}
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Failed to save video metadata cache {self.cache_path}: {e}")
+
+    def probe(self, kind: str, path: str, size: int, mtime_ns: int) -> Any:
+        """Return probe *kind* for a file version, probing only on a miss."""
+        key = f"{path}|{size}|{mtime_ns}"
+        with self._lock:
+            self._used.add(key)
+            entry = self._entries.get(key)
+            if entry is not None and kind in entry:
+                return entry[kind]
+
+        value = _cached_probe(kind, path, size, mtime_ns)
+
+        with self._lock:
+            self._entries.setdefault(key, {})[kind] = value
+        return value
+
+
+def _probe(
+    kind: str, video_path: str | Path, meta_cache: VideoMetaCache | None
+) -> Any:
+    key = _file_key(video_path)
+    if meta_cache is not None:
+        return meta_cache.probe(kind, *key)
+    return _cached_probe(kind, *key)
+
+
+def get_video_duration(
+    video_path: str | Path, meta_cache: VideoMetaCache | None = None
+) -> float:
     """Get video duration in seconds.
 
+    Results are memoized per (path, size, mtime).
+
     Args:
         video_path: Path to the video file.
+        meta_cache: Optional persisted cache to read from and record into.
 
     Returns:
         Video duration in seconds, or 0.0 if unable to determine.
     """
     try:
-        with video_capture(video_path) as cap:
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            if fps <= 0:
-                logger.warning(f"Invalid FPS for {video_path}: {fps}")
-                return 0.0
-
-            duration = frame_count / fps
-            return duration
+        return _probe("duration", video_path, meta_cache)
 
     except Exception as e:
         logger.error(f"Failed to get duration for {video_path}: {e}")
         return 0.0
 
 
-def get_video_info(video_path: str | Path) -> dict[str, Any]:
+def get_video_info(
+    video_path: str | Path, meta_cache: VideoMetaCache | None = None
+) -> dict[str, Any]:
     """Get comprehensive video information.
 
+    Results are memoized per (path, size, mtime).
+
     Args:
         video_path: Path to the video file.
+        meta_cache: Optional persisted cache to read from and record into.
 
     Returns:
         Dictionary containing video metadata including fps, frame count,
         duration, width, and height.
     """
     try:
-        with video_capture(video_path) as cap:
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-            duration = 0.0
-            if fps > 0:
-                duration = frame_count / fps
-
-            return {
-                "fps": fps,
-                "frame_count": frame_count,
-                "width": width,
-                "height": height,
-                "duration": duration,
-                "resolution": f"{width}x{height}",
-            }
+        # Copy so callers cannot mutate the cached dict
+        return dict(_probe("info", video_path, meta_cache))
 
     except Exception as e:
         logger.error(f"Failed to get video info for {video_path}: {e}")
@@ -0,0 +1,128 @@
+"""Tests for DownloadTracker and SqliteDownloadTracker dedup and resume."""
+
+import csv
+import importlib
+
+import pytest
+
+URLS = [f"https://www.tiktok.com/@user/video/{i}" for i in range(25)]
+
+
+@pytest.fixture(scope="module")
+def tracker_module(tmp_path_factory):
+    # TT_batch_downloader.main opens tiktok_download.log in the working
+    # directory at import time; keep it out of the repository
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("logs"))
+        return importlib.import_module("TT_batch_downloader.main")
+
+
+@pytest.fixture(params=["DownloadTracker", "SqliteDownloadTracker"])
+def tracker_cls(request, tracker_module):
+    return getattr(tracker_module, request.param)
+
+
+def _csv_path(tmp_path, tracker_module):
+    return tmp_path / tracker_module.DownloadTracker.CSV_FILENAME
+
+
+def test_new_tracker_has_nothing_processed(tmp_path, tracker_module, tracker_cls):
+    with tracker_cls(_csv_path(tmp_path, tracker_module)) as tracker:
+        assert not tracker.is_processed(URLS[0])
+
+
+def test_recorded_urls_are_deduplicated(tmp_path, tracker_module, tracker_cls):
+    with tracker_cls(_csv_path(tmp_path, tracker_module)) as tracker:
+        tracker.record_download(URLS[0], "/videos/0.mp4")
+        assert tracker.is_processed(URLS[0])
+        assert not tracker.is_processed(URLS[1])
+
+
+def test_tracker_resumes_after_close(tmp_path, tracker_module, tracker_cls):
+    csv_path = _csv_path(tmp_path, tracker_module)
+    # More rows than FLUSH_EVERY, so some are only written on close
+    with tracker_cls(csv_path) as tracker:
+        for i, url in enumerate(URLS[:13]):
+            tracker.record_download(url, f"/videos/{i}.mp4")
+
+    with tracker_cls(csv_path) as tracker:
+        assert all(tracker.is_processed(url) for url in URLS[:13])
+        assert not any(tracker.is_processed(url) for url in URLS[13:])
+
+
+def test_csv_tracker_writes_rows(tmp_path, tracker_module):
+    csv_path = _csv_path(tmp_path, tracker_module)
+    with tracker_module.DownloadTracker(csv_path) as tracker:
+        tracker.record_download(URLS[0], "/videos/0.mp4")
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"url": URLS[0], "Video Path": "/videos/0.mp4"}]
+
+
+def test_csv_tracker_switches_to_bloom_filter(tmp_path, tracker_module, monkeypatch):
+    tracker_cls = tracker_module.DownloadTracker
+    monkeypatch.setattr(tracker_cls, "BLOOM_THRESHOLD", 5)
+    csv_path = _csv_path(tmp_path, tracker_module)
+    # A comma forces csv quoting, which the CSV confirmation must match
+    quoted_url = "https://www.tiktok.com/@user/video/99?a=1,2"
+    with tracker_cls(csv_path) as tracker:
+        for i, url in enumerate(URLS[:10] + [quoted_url]):
+            tracker.record_download(url, f"/videos/{i}.mp4")
+
+    with tracker_cls(csv_path) as tracker:
+        assert not tracker.urls_in_memory
+        assert all(tracker.is_processed(url) for url in URLS[:10])
+        assert tracker.is_processed(quoted_url)
+        assert not tracker.is_processed(URLS[10])
+
+        tracker.record_download(URLS[10], "/videos/10.mp4")
+        assert tracker.is_processed(URLS[10])
+
+
+def test_csv_tracker_confirms_bloom_hits_exactly(tmp_path, tracker_module, monkeypatch):
+    tracker_cls = tracker_module.DownloadTracker
+    monkeypatch.setattr(tracker_cls, "BLOOM_THRESHOLD", 5)
+    monkeypatch.setattr(tracker_cls, "ROWS_PER_BUCKET", 2)
+    # Every URL passes the filter, so only the row index decides
+    monkeypatch.setattr(
+        tracker_module._UrlBloomFilter, "__contains__", lambda self, item: True
+    )
+    csv_path = _csv_path(tmp_path, tracker_module)
+    with tracker_cls(csv_path) as tracker:
+        for i, url in enumerate(URLS[:12]):
+            tracker.record_download(url, f"/videos/{i}.mp4")
+
+    with tracker_cls(csv_path) as tracker:
+        assert all(tracker.is_processed(url) for url in URLS[:12])
+        # Prefixes and extensions of recorded URLs are not matches
+        assert not tracker.is_processed(URLS[1][:-1])
+        assert not tracker.is_processed(URLS[1] + "9")
+        assert not tracker.is_processed(URLS[12])
+
+        tracker.record_download(URLS[12], "/videos/12.mp4")
+        assert tracker.is_processed(URLS[12])
+
+
+def test_sqlite_tracker_imports_legacy_csv(tmp_path, tracker_module):
+    csv_path = _csv_path(tmp_path, tracker_module)
+    with tracker_module.DownloadTracker(csv_path) as tracker:
+        for i, url in enumerate(URLS[:3]):
+            tracker.record_download(url, f"/videos/{i}.mp4")
+
+    with tracker_module.SqliteDownloadTracker(csv_path) as tracker:
+        assert all(tracker.is_processed(url) for url in URLS[:3])
+        assert not tracker.is_processed(URLS[3])
+    assert csv_path.with_name(tracker_module.SqliteDownloadTracker.DB_FILENAME).exists()
+
+
+def test_sqlite_tracker_ignores_duplicate_records(tmp_path, tracker_module):
+    csv_path = _csv_path(tmp_path, tracker_module)
+    with tracker_module.SqliteDownloadTracker(csv_path) as tracker:
+        tracker.record_download(URLS[0], "/videos/0.mp4")
+        tracker.record_download(URLS[0], "/videos/0-again.mp4")
+        tracker.flush()
+        (count,) = tracker._connect().execute(
+            "SELECT COUNT(*) FROM downloads"
+        ).fetchone()
+    assert count == 1
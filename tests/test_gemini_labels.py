@@ -0,0 +1,102 @@
+"""Tests for Gemini label parsing (_LABEL_RE, LabelResult, _parse_gemini_label)."""
+
+import pytest
+
+from run_video_processing.gemini_utils import (
+    LabelResult,
+    _complete_label_line,
+    extract_labels,
+)
+from run_video_processing.video_labeler import _parse_gemini_label
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ("合格-合格-合格-合格", ("合格", "合格", "合格", "合格")),
+        ("合格 - 不合格 -合格- 合格", ("合格", "不合格", "合格", "合格")),
+        ("**结果**：不合格-合格-合格-合格\n理由：背景杂乱", ("不合格", "合格", "合格", "合格")),
+        ("```\n合格-合格-不合格-合格\n```", ("合格", "合格", "不合格", "合格")),
+    ],
+)
+def test_extract_labels_finds_four_labels(response, expected):
+    assert extract_labels(response) == expected
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "",
+        "合格-合格-合格",
+        "合格-合格-合格-合格-合格",
+        "合格 - 合格-合格-合格 -不合格",
+        "- 不合格-合格-合格-合格",
+        "结果 - 不合格-合格-合格-合格",
+        "不合格-不合格-合格-合格-合格",
+        "合格 -  合格-合格-合格-合格",
+        "无法判断",
+    ],
+)
+def test_extract_labels_rejects_malformed(response):
+    assert extract_labels(response) is None
+
+
+def test_label_result_all_pass():
+    result = LabelResult.parse_from_response("合格-合格-合格-合格")
+    assert result.final_score == "合格"
+    assert result.raw_response == "合格-合格-合格-合格"
+
+
+def test_label_result_one_fail():
+    result = LabelResult.parse_from_response("合格-合格-不合格-合格")
+    assert result.dimension_3 == "不合格"
+    assert result.final_score == "不合格"
+
+
+def test_label_result_defaults_to_fail_on_bad_format():
+    result = LabelResult.parse_from_response("合格-合格-合格-合格-合格")
+    assert (
+        result.dimension_1,
+        result.dimension_2,
+        result.dimension_3,
+        result.dimension_4,
+    ) == ("不合格",) * 4
+    assert result.final_score == "不合格"
+
+
+def test_label_result_filename_safe_string():
+    result = LabelResult.parse_from_response("合格-不合格-合格-合格")
+    assert result.to_filename_safe_string() == "环境合格-功能不合格-文案合格-品牌合格"
+
+
+def test_complete_label_line_waits_for_newline():
+    assert _complete_label_line("合格-合格-合格-合格") is None
+    assert _complete_label_line("合格-合格-合格-合格\n理由") == "合格-合格-合格-合格"
+    assert _complete_label_line("好的，结果如下\n合格-合格-合格-合格\n") is None
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "合格-合格-合格-合格",
+        "结果：合格-合格-合格-合格，全部达标",
+        "合格-不合格-合格-合格",
+        "合格-合格-合格",
+        "标签生成失败",
+        "未标注",
+        "",
+    ],
+)
+def test_parse_gemini_label_agrees_with_label_result(response):
+    _, final_score = _parse_gemini_label(response)
+    assert final_score == LabelResult.parse_from_response(response).final_score
+
+
+def test_parse_gemini_label_display():
+    display, final_score = _parse_gemini_label("合格-不合格-合格-合格")
+    assert display == "环境:合格 / 功能:不合格 / 文案:合格 / 品牌:合格"
+    assert final_score == "不合格"
+
+
+def test_parse_gemini_label_passes_through_unlabelled():
+    assert _parse_gemini_label("标签生成失败") == ("标签生成失败", "不合格")
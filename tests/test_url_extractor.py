@@ -0,0 +1,131 @@
+"""Tests for URLExtractor format detection and ZIP extraction."""
+
+import zipfile
+
+import pytest
+
+from TT_batch_downloader.url_extractor import FileType, URLExtractor
+
+URLS = [f"https://www.tiktok.com/@user/video/{i}" for i in range(6)]
+
+
+@pytest.fixture
+def extractor():
+    return URLExtractor()
+
+
+def _write_csv(path, separator=",", encoding="utf-8", header=("url", "note")):
+    lines = [separator.join(header)]
+    lines += [separator.join((url, f"备注{i}")) for i, url in enumerate(URLS)]
+    path.write_bytes(("\n".join(lines) + "\n").encode(encoding))
+    return path
+
+
+def test_check_file_type(tmp_path, extractor):
+    text_path = _write_csv(tmp_path / "urls.csv")
+    zip_path = tmp_path / "urls.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.write(text_path, "urls.csv")
+
+    assert extractor._check_file_type(text_path) == FileType.TEXT
+    assert extractor._check_file_type(zip_path) == FileType.ZIP
+
+
+@pytest.mark.parametrize("separator", [",", ";", "\t"])
+def test_detects_separator(tmp_path, extractor, separator):
+    path = _write_csv(tmp_path / "urls.csv", separator=separator)
+    assert extractor._detect_csv_format(path) == ("utf-8", separator)
+    assert extractor.extract_from_file(path) == URLS
+
+
+def test_detects_gbk_encoding(tmp_path, extractor):
+    path = _write_csv(tmp_path / "urls.csv", encoding="gbk")
+    encoding, _ = extractor._detect_csv_format(path)
+    assert encoding == "gbk"
+    assert extractor.extract_from_file(path) == URLS
+
+
+def test_finds_url_column_by_name(tmp_path, extractor):
+    path = _write_csv(tmp_path / "urls.csv", header=("video_link", "note"))
+    assert extractor.extract_from_file(path) == URLS
+
+
+def test_skips_non_http_values(tmp_path, extractor):
+    path = tmp_path / "urls.csv"
+    path.write_text(
+        "url\n" + URLS[0] + "\njavascript:alert(1)\n\n" + URLS[1] + "\n",
+        encoding="utf-8",
+    )
+    assert extractor.extract_from_file(path) == URLS[:2]
+
+
+def test_regex_fallback_reads_only_the_url_column(tmp_path, extractor):
+    path = tmp_path / "urls.csv"
+    rows = [f"{url},https://www.tiktok.com/@user{i}" for i, url in enumerate(URLS)]
+    # An unterminated quote on the last row makes pandas give up
+    path.write_text(
+        "url,profile\n" + "\n".join(rows) + '\n"' + URLS[0] + "/extra\n",
+        encoding="utf-8",
+    )
+    assert extractor.extract_from_file(path) == URLS + [URLS[0] + "/extra"]
+
+
+def test_falls_back_to_regex(tmp_path, extractor):
+    path = tmp_path / "notes.txt"
+    path.write_text(
+        f"see {URLS[0]} and\n'{URLS[1]}'; also ftp://example.com\n",
+        encoding="utf-8",
+    )
+    assert extractor.extract_from_file(path) == URLS[:2]
+
+
+def test_regex_stops_at_unicode_spaces(tmp_path, extractor):
+    path = tmp_path / "notes.txt"
+    path.write_text(
+        f"视频\u3000{URLS[0]}\u3000备注\n链接 {URLS[1]}\u00a0已下载\n"
+        f"路径 {URLS[2]}/中文路径\n",
+        encoding="utf-8",
+    )
+    assert extractor.extract_from_file(path) == [URLS[0], URLS[1], f"{URLS[2]}/中文路径"]
+
+
+def test_missing_file_raises(tmp_path, extractor):
+    with pytest.raises(FileNotFoundError):
+        extractor.extract_from_file(tmp_path / "missing.csv")
+
+
+def test_extracts_from_zip(tmp_path, extractor):
+    csv_path = _write_csv(tmp_path / "source.csv")
+    zip_path = tmp_path / "batch.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.write(csv_path, "exports/2024/urls.csv")
+        zf.writestr("exports/readme.md", "not a URL file")
+
+    assert extractor.extract_from_file(zip_path) == URLS
+    assert (tmp_path / "batch_extracted" / "exports" / "2024" / "urls.csv").is_file()
+    assert not (tmp_path / "batch_extracted" / "exports" / "readme.md").exists()
+
+
+def test_parallel_extraction_of_shared_directories(tmp_path, extractor):
+    # Many members under a few shared parents: workers must not race on
+    # creating those directories
+    zip_path = tmp_path / "many.zip"
+    members = [f"d{i % 2}/sub/part_{i}.txt" for i in range(64)]
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i, name in enumerate(members):
+            zf.writestr(name, f"url\n{URLS[i % len(URLS)]}\n")
+
+    for attempt in range(20):
+        extract_folder = tmp_path / f"out_{attempt}"
+        extract_folder.mkdir()
+        extractor._extract_members(zip_path, members, extract_folder)
+        assert all((extract_folder / name).is_file() for name in members)
+
+
+def test_zip_without_url_files_raises(tmp_path, extractor):
+    zip_path = tmp_path / "empty.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("readme.md", "nothing here")
+
+    with pytest.raises(ValueError):
+        extractor.extract_from_file(zip_path)
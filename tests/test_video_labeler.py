@@ -0,0 +1,207 @@
+"""Tests for the concurrent labelling pipeline in video_labeler."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from run_video_processing import gemini_utils, video_labeler
+from run_video_processing.gemini_utils import LabelResult
+from run_video_processing.label_cache import LabelCache
+
+# A deadlock must fail the test rather than hang the suite
+RUN_TIMEOUT_SECONDS = 30
+
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    """Replace client setup and the Gemini call; return the list of labelled paths."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_label(client, video_path, prompt=None, model=None):
+        time.sleep(0.01)
+        with lock:
+            calls.append(os.path.basename(video_path))
+        return LabelResult.parse_from_response("合格-合格-合格-合格")
+
+    monkeypatch.setattr(video_labeler, "setup_gemini_client", lambda *args: object())
+    monkeypatch.setattr(gemini_utils, "label_video_with_gemini", fake_label)
+    monkeypatch.setattr(video_labeler, "get_video_duration", lambda *args: 1.0)
+    video_labeler._gemini_client.cache_clear()
+    yield calls
+    video_labeler._gemini_client.cache_clear()
+
+
+@pytest.fixture
+def video_folders(tmp_path):
+    input_folder = tmp_path / "in"
+    output_folder = tmp_path / "out"
+    input_folder.mkdir()
+    output_folder.mkdir()
+    names = [f"video_{i:02d}.mp4" for i in range(16)]
+    for name in names:
+        (input_folder / name).write_bytes(os.urandom(256))
+    return input_folder, output_folder, names
+
+
+def _run(coro_factory):
+    """Run a coroutine on a daemon thread so a deadlock fails instead of hanging."""
+    outcome = {}
+
+    async def main():
+        outcome["loop"] = asyncio.get_running_loop()
+        return await coro_factory()
+
+    def target():
+        try:
+            outcome["value"] = asyncio.run(main())
+        except BaseException as e:  # noqa: BLE001 - re-raised below
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(RUN_TIMEOUT_SECONDS)
+    if thread.is_alive():
+        # Cancel every task so blocked executor threads are released; otherwise
+        # the interpreter hangs joining them at exit
+        loop = outcome["loop"]
+        loop.call_soon_threadsafe(
+            lambda: [task.cancel() for task in asyncio.all_tasks(loop)]
+        )
+        thread.join(RUN_TIMEOUT_SECONDS)
+        pytest.fail("labelling pipeline did not finish (deadlock?)")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def _process(input_folder, output_folder, names, **kwargs):
+    return _run(
+        lambda: video_labeler._process_videos(
+            names, input_folder, output_folder, "project", "location", 8, **kwargs
+        )
+    )
+
+
+@pytest.mark.parametrize("cpu_count", [1, 2, 4])
+def test_process_videos_finishes_on_few_cpus(
+    monkeypatch, fake_gemini, video_folders, cpu_count
+):
+    # The default executor is sized from os.cpu_count() when the loop creates it
+    monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
+    input_folder, output_folder, names = video_folders
+
+    results = _process(input_folder, output_folder, names)
+
+    assert list(results) == names
+    assert all(entry["status"] == "success" for entry in results.values())
+    assert sorted(fake_gemini) == names
+    for name in names:
+        info = results[name]["processed_video_info"]
+        assert info.final_score == "合格"
+        assert (output_folder / info.relative_video_path).is_file()
+
+
+def test_process_videos_reports_gemini_failure(monkeypatch, fake_gemini, video_folders):
+    def failing_label(*args, **kwargs):
+        raise gemini_utils.GeminiError("boom")
+
+    monkeypatch.setattr(gemini_utils, "label_video_with_gemini", failing_label)
+    input_folder, output_folder, names = video_folders
+
+    results = _process(input_folder, output_folder, names[:2])
+
+    for entry in results.values():
+        assert entry["status"] == "success"
+        assert entry["processed_video_info"].gemini_raw == "标签生成失败"
+        assert entry["processed_video_info"].final_score == "不合格"
+
+
+def test_label_cache_skips_gemini_for_known_content(fake_gemini, video_folders):
+    input_folder, output_folder, names = video_folders
+    cache = LabelCache(output_folder)
+    try:
+        _process(input_folder, output_folder, names, label_cache=cache)
+        assert len(fake_gemini) == len(names)
+
+        fake_gemini.clear()
+        results = _process(input_folder, output_folder, names, label_cache=cache)
+    finally:
+        cache.close()
+
+    assert fake_gemini == []
+    assert all(entry["status"] == "success" for entry in results.values())
+
+
+def test_label_cache_skips_malformed_responses(monkeypatch, fake_gemini, video_folders):
+    def malformed_label(client, video_path, prompt=None, model=None):
+        fake_gemini.append(os.path.basename(video_path))
+        return LabelResult.parse_from_response("无法判断")
+
+    monkeypatch.setattr(gemini_utils, "label_video_with_gemini", malformed_label)
+    input_folder, output_folder, names = video_folders
+    cache = LabelCache(output_folder)
+    try:
+        _process(input_folder, output_folder, names[:1], label_cache=cache)
+        _process(input_folder, output_folder, names[:1], label_cache=cache)
+    finally:
+        cache.close()
+
+    assert fake_gemini == [names[0]] * 2
+
+
+def test_resume_skips_finished_videos(monkeypatch, fake_gemini, video_folders):
+    input_folder, output_folder, names = video_folders
+    cache = LabelCache(output_folder)
+    try:
+        first = _process(input_folder, output_folder, names, label_cache=cache)
+
+        copies = []
+        monkeypatch.setattr(
+            video_labeler, "_copy_labeled", lambda src, dst: copies.append(dst)
+        )
+        second = _process(
+            input_folder, output_folder, names, label_cache=cache, resume=True
+        )
+    finally:
+        cache.close()
+
+    assert copies == []
+    for name in names:
+        assert second[name]["processed_video_info"] == first[name]["processed_video_info"]
+
+
+def test_resume_reprocesses_changed_content(fake_gemini, video_folders):
+    input_folder, output_folder, names = video_folders
+    cache = LabelCache(output_folder)
+    try:
+        _process(input_folder, output_folder, names[:1], label_cache=cache)
+        (input_folder / names[0]).write_bytes(os.urandom(512))
+
+        fake_gemini.clear()
+        _process(input_folder, output_folder, names[:1], label_cache=cache, resume=True)
+    finally:
+        cache.close()
+
+    assert fake_gemini == [names[0]]
+
+
+def test_resume_retries_malformed_responses(monkeypatch, fake_gemini, video_folders):
+    def malformed_label(client, video_path, prompt=None, model=None):
+        fake_gemini.append(os.path.basename(video_path))
+        return LabelResult.parse_from_response("无法判断")
+
+    monkeypatch.setattr(gemini_utils, "label_video_with_gemini", malformed_label)
+    input_folder, output_folder, names = video_folders
+    cache = LabelCache(output_folder)
+    try:
+        _process(input_folder, output_folder, names[:1], label_cache=cache)
+        _process(input_folder, output_folder, names[:1], label_cache=cache, resume=True)
+    finally:
+        cache.close()
+
+    assert fake_gemini == [names[0]] * 2
+    assert not (output_folder / "video_00" / video_labeler.LABEL_RECORD_FILENAME).exists()